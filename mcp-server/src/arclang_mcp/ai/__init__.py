@@ -2,6 +2,6 @@
 AI-powered generation utilities.
 """
 
-from .generator import AIGenerator
+from .generator import AIGenerator, close_clients
 
-__all__ = ["AIGenerator"]
+__all__ = ["AIGenerator", "close_clients"]
@@ -2,39 +2,31 @@
 AI-powered code generation for ArcLang.
 """
 
+import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import anthropic
+if TYPE_CHECKING:
+    import anthropic
+    import httpx
 
+# Clients shared across AIGenerator instances, keyed by (provider, api_key),
+# so concurrent tools reuse the same HTTP keep-alive connections.
+_CLIENT_CACHE: Dict[Tuple[str, str], "anthropic.AsyncAnthropic"] = {}
 
-class AIGenerator:
-    """AI-powered ArcLang code generator."""
-
-    def __init__(self, config: Dict[str, Any]):
-        self.provider = config.get("provider", "anthropic")
-        self.model = config.get("model", "claude-3-5-sonnet-20241022")
-        self.temperature = config.get("temperature", 0.3)
-        self.client: Optional[anthropic.AsyncAnthropic] = None
-
-        if self.provider == "anthropic":
-            api_key = config.get("api_key") or os.getenv("ANTHROPIC_API_KEY")
-            if api_key:
-                self.client = anthropic.AsyncAnthropic(api_key=api_key)
-
-    async def generate_requirement(
-        self,
-        description: str,
-        safety_level: Optional[str] = None,
-        priority: str = "High"
-    ) -> str:
-        """Generate ArcLang requirement from description."""
+# Connection pool shared by every client above; HTTP/2 is used when h2 is installed
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_MAX_CONNECTIONS = 64
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
 
-        prompt = f"""Generate an ArcLang requirement based on this description:
+# Prompt and fallback templates, formatted per call with str.format.
+REQUIREMENT_PROMPT = """Generate an ArcLang requirement based on this description:
 
 Description: {description}
-Safety Level: {safety_level or 'Not specified'}
+Safety Level: {safety_label}
 Priority: {priority}
 
 Generate a complete ArcLang requirement block following this format:
@@ -42,7 +34,7 @@ Generate a complete ArcLang requirement block following this format:
 requirement "REQ-XXX-YYY" {{
     description: "..."
     priority: "{priority}"
-    {f'safety_level: "{safety_level}"' if safety_level else '// safety_level: "TBD"'}
+    {safety_line}
     type: "Functional"  // or Performance, Safety, etc.
     verification_method: "Test"  // or Analysis, Inspection, Demonstration
 }}
@@ -55,38 +47,19 @@ Important:
 
 Generate only the ArcLang code, no explanation."""
 
-        if self.client:
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text.strip()
-        else:
-            # Fallback template
-            req_id = self._generate_requirement_id(description)
-            return f'''requirement "{req_id}" {{
+REQUIREMENT_FALLBACK = '''requirement "{req_id}" {{
     description: "{description}"
     priority: "{priority}"
-    {f'safety_level: "{safety_level}"' if safety_level else '// safety_level: "TBD"'}
+    {safety_line}
     type: "Functional"
     verification_method: "Test"
 }}'''
 
-    async def generate_component(
-        self,
-        description: str,
-        component_type: str = "Logical",
-        safety_level: Optional[str] = None
-    ) -> str:
-        """Generate ArcLang component from description."""
-
-        prompt = f"""Generate an ArcLang component based on this description:
+COMPONENT_PROMPT = """Generate an ArcLang component based on this description:
 
 Description: {description}
 Type: {component_type}
-Safety Level: {safety_level or 'Not specified'}
+Safety Level: {safety_label}
 
 Generate a complete ArcLang component block following this format:
 
@@ -94,7 +67,7 @@ component "Component Name" {{
     id: "LC-XXX-YYY"
     type: "{component_type}"
     description: "..."
-    {f'safety_level: "{safety_level}"' if safety_level else ''}
+    {safety_line}
 
     function "Main Function" {{
         id: "LF-XXX-YYY"
@@ -113,22 +86,11 @@ Important:
 
 Generate only the ArcLang code, no explanation."""
 
-        if self.client:
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text.strip()
-        else:
-            # Fallback template
-            comp_id = self._generate_component_id(description)
-            return f'''component "{description}" {{
+COMPONENT_FALLBACK = '''component "{description}" {{
     id: "{comp_id}"
     type: "{component_type}"
     description: "{description}"
-    {f'safety_level: "{safety_level}"' if safety_level else ''}
+    {safety_line}
 
     function "Process" {{
         id: "LF-PROCESS"
@@ -137,16 +99,7 @@ Generate only the ArcLang code, no explanation."""
     }}
 }}'''
 
-    async def suggest_architecture(
-        self,
-        requirements: List[str],
-        domain: str = "automotive"
-    ) -> Dict[str, Any]:
-        """Suggest architecture based on requirements."""
-
-        req_list = "\n".join([f"- {req}" for req in requirements])
-
-        prompt = f"""Given these requirements for a {domain} system, suggest an appropriate architecture:
+ARCHITECTURE_PROMPT = """Given these requirements for a {domain} system, suggest an appropriate architecture:
 
 Requirements:
 {req_list}
@@ -170,6 +123,129 @@ Provide suggestions in JSON format:
     "patterns": ["Pattern 1", "Pattern 2"]
 }}"""
 
+ARCHITECTURE_BATCH_PROMPT = """Suggest an appropriate architecture for each of the {count} numbered requests below.
+
+{requests}
+
+For each request suggest:
+1. Main components (5-10 components)
+2. Component types (Logical/Physical)
+3. Safety levels if applicable
+4. Recommended architectural patterns
+
+Provide suggestions as a JSON array with exactly one object per request, in request order:
+[
+    {{
+        "components": [
+            {{
+                "name": "Component Name",
+                "type": "Logical",
+                "description": "Brief description",
+                "safety_level": "ASIL_B"  // if applicable
+            }}
+        ],
+        "patterns": ["Pattern 1", "Pattern 2"]
+    }}
+]"""
+
+ARCHITECTURE_BATCH_ITEM = """Request {index} ({domain} system) requirements:
+{req_list}"""
+
+# First character of each whitespace-separated word.
+_WORD_START_RE = re.compile(r"(?<!\S)\S")
+
+
+class AIGenerator:
+    """AI-powered ArcLang code generator."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.provider = config.get("provider", "anthropic")
+        self.model = config.get("model", "claude-3-5-sonnet-20241022")
+        self.temperature = config.get("temperature", 0.3)
+        self.client: Optional["anthropic.AsyncAnthropic"] = None
+
+        if self.provider == "anthropic":
+            api_key = config.get("api_key") or os.getenv("ANTHROPIC_API_KEY")
+            if api_key:
+                self.client = _get_client(self.provider, api_key)
+
+    async def generate_requirement(
+        self,
+        description: str,
+        safety_level: Optional[str] = None,
+        priority: str = "High"
+    ) -> str:
+        """Generate ArcLang requirement from description."""
+
+        prompt = REQUIREMENT_PROMPT.format(
+            description=description,
+            safety_label=safety_level or "Not specified",
+            priority=priority,
+            safety_line=_requirement_safety_line(safety_level)
+        )
+
+        if self.client:
+            message = await self.client.messages.create(
+                model=self.model,
+                max_tokens=1024,
+                temperature=self.temperature,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return message.content[0].text.strip()
+        else:
+            # Fallback template
+            req_id = self._generate_requirement_id(description)
+            return REQUIREMENT_FALLBACK.format(
+                req_id=req_id,
+                description=description,
+                priority=priority,
+                safety_line=_requirement_safety_line(safety_level)
+            )
+
+    async def generate_component(
+        self,
+        description: str,
+        component_type: str = "Logical",
+        safety_level: Optional[str] = None
+    ) -> str:
+        """Generate ArcLang component from description."""
+
+        prompt = COMPONENT_PROMPT.format(
+            description=description,
+            component_type=component_type,
+            safety_label=safety_level or "Not specified",
+            safety_line=_component_safety_line(safety_level)
+        )
+
+        if self.client:
+            message = await self.client.messages.create(
+                model=self.model,
+                max_tokens=2048,
+                temperature=self.temperature,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return message.content[0].text.strip()
+        else:
+            # Fallback template
+            comp_id = self._generate_component_id(description)
+            return COMPONENT_FALLBACK.format(
+                comp_id=comp_id,
+                description=description,
+                component_type=component_type,
+                safety_line=_component_safety_line(safety_level)
+            )
+
+    async def suggest_architecture(
+        self,
+        requirements: List[str],
+        domain: str = "automotive"
+    ) -> Dict[str, Any]:
+        """Suggest architecture based on requirements."""
+
+        req_list = "\n".join([f"- {req}" for req in requirements])
+
+        prompt = ARCHITECTURE_PROMPT.format(domain=domain, req_list=req_list)
+
         if self.client:
             message = await self.client.messages.create(
                 model=self.model,
@@ -192,14 +268,122 @@ Provide suggestions in JSON format:
                 "patterns": ["Layered Architecture", "Sense-Process-Actuate"]
             }
 
+    async def suggest_architecture_batch(
+        self,
+        items: List[Tuple[List[str], str]]
+    ) -> List[Dict[str, Any]]:
+        """Suggest architectures for several (requirements, domain) pairs.
+
+        With a client, all pairs share one numbered prompt and one API call;
+        if the reply is not a JSON array of matching length, each pair is
+        retried with suggest_architecture. Results are in input order.
+        """
+        if not self.client or len(items) == 1:
+            return list(await asyncio.gather(
+                *(self.suggest_architecture(requirements, domain) for requirements, domain in items)
+            ))
+
+        prompt = ARCHITECTURE_BATCH_PROMPT.format(
+            count=len(items),
+            requests="\n\n".join(
+                ARCHITECTURE_BATCH_ITEM.format(
+                    index=index,
+                    domain=domain,
+                    req_list="\n".join([f"- {req}" for req in requirements])
+                )
+                for index, (requirements, domain) in enumerate(items, 1)
+            )
+        )
+
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=min(2048 * len(items), 8192),
+            temperature=self.temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        try:
+            suggestions = json.loads(message.content[0].text.strip())
+        except (json.JSONDecodeError, IndexError, AttributeError):
+            suggestions = None
+
+        if (
+            isinstance(suggestions, list)
+            and len(suggestions) == len(items)
+            and all(isinstance(s, dict) for s in suggestions)
+        ):
+            return suggestions
+        return list(await asyncio.gather(
+            *(self.suggest_architecture(requirements, domain) for requirements, domain in items)
+        ))
+
     def _generate_requirement_id(self, description: str) -> str:
         """Generate requirement ID from description."""
-        words = description.split()[:2]
-        prefix = "".join([w[0].upper() for w in words if w])
-        return f"REQ-{prefix}-001"
+        return f"REQ-{_initials(description)}-001"
 
     def _generate_component_id(self, description: str) -> str:
         """Generate component ID from description."""
-        words = description.split()[:2]
-        prefix = "".join([w[0].upper() for w in words if w])
-        return f"LC-{prefix}-001"
+        return f"LC-{_initials(description)}-001"
+
+
+def _requirement_safety_line(safety_level: Optional[str]) -> str:
+    """safety_level attribute line for requirement blocks."""
+    return f'safety_level: "{safety_level}"' if safety_level else '// safety_level: "TBD"'
+
+
+def _component_safety_line(safety_level: Optional[str]) -> str:
+    """safety_level attribute line for component blocks."""
+    return f'safety_level: "{safety_level}"' if safety_level else ""
+
+
+def _initials(description: str) -> str:
+    """Uppercased first character of the first two words of description."""
+    return "".join(m.group() for m in islice(_WORD_START_RE.finditer(description), 2)).upper()
+
+
+def _get_client(provider: str, api_key: str) -> "anthropic.AsyncAnthropic":
+    """Return the shared client for (provider, api_key), creating it on first use."""
+    key = (provider, api_key)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        # Imported lazily so the fallback template path never pays for it
+        import anthropic
+
+        client = _CLIENT_CACHE[key] = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=_get_http_client(),
+        )
+    return client
+
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import anthropic
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+        else:
+            http2 = True
+
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=http2,
+            timeout=anthropic.DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_clients() -> None:
+    """Close the shared HTTP connections and drop the cached AI clients."""
+    global _HTTP_CLIENT
+    _CLIENT_CACHE.clear()
+    if _HTTP_CLIENT is not None:
+        http_client, _HTTP_CLIENT = _HTTP_CLIENT, None
+        await http_client.aclose()
@@ -6,38 +6,77 @@ src/cli/mod.rs. Flags that do not exist in the CLI are never emitted.
 Parsers only extract data that the binary actually prints; when the
 binary does not expose structured output, methods return None together
 with "parse_supported": False instead of fabricating results.
+
+Compilation happens in the child process started by _run_command; the
+event loop only awaits its pipes, so concurrent tool calls are never
+blocked by a long build and no thread or process pool is needed.
 """
 
 import asyncio
 import os
 import re
+import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Substrings that mark a line as an error in compiler output.
 ERROR_MARKERS = ("error", "Error", "✗")
 
+# Number of command results kept by the (model mtime, args) result cache.
+RESULT_CACHE_SIZE = 128
+
+# Count lines printed by `build`/`info`, e.g. '  Requirements: 12'.
+METRIC_RE = re.compile(r"^\s*(Requirements|Components|Functions|Traces)\s*:\s*(\d+)\s*$", re.I)
+
+# Coverage lines, e.g. 'Traceability Coverage: 85.0%'.
+COVERAGE_RE = re.compile(r"coverage:\s*([0-9]+(?:\.[0-9]+)?)\s*%", re.I)
+
+# Element count line printed by `diagram` for each diagram type.
+ELEMENT_COUNT_RES = {
+    diagram_type: re.compile(pattern)
+    for diagram_type, pattern in {
+        "operational": r"Activities: (\d+)",
+        "functional": r"Functions: (\d+)",
+        "component": r"Components: (\d+)",
+        "sequence": r"Messages: (\d+)",
+        "state-machine": r"States: (\d+)",
+        "physical": r"Nodes: (\d+)",
+        "class": r"Classes: (\d+)",
+        "tree": r"Nodes: (\d+)",
+        "capability": r"Capabilities: (\d+)",
+        "functional-chain": r"Functions: (\d+)",
+    }.items()
+}
+
 
 class ArcLangCompiler:
     """Wrapper for ArcLang compiler binary."""
 
     def __init__(self, config: Dict[str, Any]):
         # Try environment variable first, then config, then default
-        self.binary_path = (
+        binary = (
             os.getenv("ARCLANG_BINARY") or
             config.get("path") or
             "arclang"
         )
+        # Resolve the PATH lookup once instead of on every spawn
+        self.binary_path = shutil.which(binary) or binary
         self.timeout = config.get("timeout", 30)
 
         # Get workspace root for resolving relative paths
         self.workspace_root = Path(os.getenv("ARCLANG_WORKSPACE", os.getcwd()))
 
+        # Raw command results keyed by (cmd, model mtime_ns, model size);
+        # editing the model changes the key, so no explicit purge is needed.
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
     async def compile(
         self,
         model_path: Path,
         validate: bool = True,
-        optimize: bool = False
+        optimize: bool = False,
+        stat: Optional[os.stat_result] = None
     ) -> Dict[str, Any]:
         """Compile ArcLang model via `arclang build`.
 
@@ -49,17 +88,23 @@ class ArcLangCompiler:
         if optimize:
             cmd.append("--release")
 
-        result = await self._run_command(cmd)
+        result = await self._run_cached(cmd, model_path, stat)
+        parsed = self._parse_all(result["stdout"])
 
         return {
             "success": result["returncode"] == 0,
             "output": result["stdout"],
             "raw_output": result["stdout"],
-            "errors": self._parse_errors(result["stderr"], result["stdout"]),
-            "metrics": self._parse_metrics(result["stdout"]) if result["returncode"] == 0 else {}
+            "errors": self._parse_errors(result["stderr"]) + parsed["errors"],
+            "metrics": parsed["metrics"] if result["returncode"] == 0 else {}
         }
 
-    async def validate(self, model_path: Path, strict: bool = False) -> Dict[str, Any]:
+    async def validate(
+        self,
+        model_path: Path,
+        strict: bool = False,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Validate ArcLang model via `arclang check --lint`.
 
         Note: the CLI has no `--strict` flag; the `strict` argument is
@@ -67,12 +112,13 @@ class ArcLangCompiler:
         """
         cmd = [self.binary_path, "check", str(model_path), "--lint"]
 
-        result = await self._run_command(cmd)
+        result = await self._run_cached(cmd, model_path, stat)
+        parsed = self._parse_all(result["stdout"])
 
         return {
             "valid": result["returncode"] == 0,
-            "warnings": self._parse_warnings(result["stdout"]),
-            "errors": self._parse_errors(result["stderr"], result["stdout"]),
+            "warnings": parsed["warnings"],
+            "errors": self._parse_errors(result["stderr"]) + parsed["errors"],
             "raw_output": result["stdout"]
         }
 
@@ -80,7 +126,8 @@ class ArcLangCompiler:
         self,
         model_path: Path,
         show_gaps: bool = True,
-        matrix: bool = False
+        matrix: bool = False,
+        stat: Optional[os.stat_result] = None
     ) -> Dict[str, Any]:
         """Analyze traceability via `arclang trace --validate`.
 
@@ -94,12 +141,13 @@ class ArcLangCompiler:
         if matrix:
             cmd.append("--matrix")
 
-        result = await self._run_command(cmd)
+        result = await self._run_cached(cmd, model_path, stat)
+        parsed = self._parse_all(result["stdout"])
 
         return {
-            "coverage": self._parse_coverage(result["stdout"]),
-            "total_traces": self._count_traces(result["stdout"]),
-            "issues": self._parse_trace_issues(result["stdout"]),
+            "coverage": parsed["coverage"],
+            "total_traces": parsed["total_traces"],
+            "issues": parsed["issues"],
             "gaps": None,
             "parse_supported": False,
             "raw_output": result["stdout"]
@@ -130,7 +178,12 @@ class ArcLangCompiler:
             "raw_output": result["stdout"]
         }
 
-    async def info(self, model_path: Path, detailed: bool = False) -> Dict[str, Any]:
+    async def info(
+        self,
+        model_path: Path,
+        detailed: bool = False,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """Get model information via `arclang info --metrics`.
 
         Note: the CLI has no `--detailed` flag; the `detailed` argument
@@ -138,11 +191,16 @@ class ArcLangCompiler:
         """
         cmd = [self.binary_path, "info", str(model_path), "--metrics"]
 
-        result = await self._run_command(cmd)
+        result = await self._run_cached(cmd, model_path, stat)
+
+        try:
+            size_kb = (stat or model_path.stat()).st_size / 1024
+        except FileNotFoundError:
+            size_kb = 0
 
         return {
-            "metrics": self._parse_metrics(result["stdout"]),
-            "size_kb": model_path.stat().st_size / 1024 if model_path.exists() else 0,
+            "metrics": self._parse_all(result["stdout"])["metrics"],
+            "size_kb": size_kb,
             "raw_output": result["stdout"]
         }
 
@@ -267,11 +325,44 @@ class ArcLangCompiler:
             "element_count": element_count
         }
 
+    async def _run_cached(
+        self,
+        cmd: list,
+        model_path: Path,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Run a read-only command, reusing the result while the model is unchanged.
+
+        Results are keyed by the command line plus the model's mtime and
+        size and kept in an LRU of RESULT_CACHE_SIZE entries. Commands
+        that could not run (timeout, missing binary) are not cached.
+        A caller that already holds the model's stat result passes it as
+        `stat` to skip a second stat() call.
+        """
+        try:
+            st = stat or model_path.stat()
+        except OSError:
+            return await self._run_command(cmd)
+
+        key = (tuple(cmd), st.st_mtime_ns, st.st_size)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return cached
+
+        result = await self._run_command(cmd)
+        if result["returncode"] != -1:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
     async def _run_command(self, cmd: list) -> Dict[str, Any]:
         """Run command asynchronously."""
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
@@ -299,126 +390,99 @@ class ArcLangCompiler:
                 "stderr": str(e)
             }
 
-    def _parse_metrics(self, output: str) -> Dict[str, Any]:
-        """Parse metrics from output."""
-        metrics = {}
-        for line in output.split("\n"):
-            if "Requirements:" in line:
-                metrics["requirements"] = self._parse_int(line)
-            elif "Components:" in line:
-                metrics["components"] = self._parse_int(line)
-            elif "Functions:" in line:
-                metrics["functions"] = self._parse_int(line)
-            elif "Traces:" in line:
-                metrics["traces"] = self._parse_int(line)
-        return {k: v for k, v in metrics.items() if v is not None}
-
-    @staticmethod
-    def _parse_int(line: str) -> Optional[int]:
-        """Parse the integer after the last colon in a line, or None."""
-        try:
-            return int(line.split(":")[-1].strip())
-        except ValueError:
-            return None
-
-    def _parse_warnings(self, output: str) -> List[str]:
-        """Parse warnings from `check` output.
-
-        The CLI prints a '⚠ Traceability warnings:' header followed by
-        indented warning lines; standalone lines containing 'warning:'
-        are also collected.
+    def _parse_all(self, output: str) -> Dict[str, Any]:
+        """Parse compiler stdout in a single pass.
+
+        Each line is classified once and the results for every consumer
+        are collected together:
+
+        - "metrics": 'Requirements: N', 'Components: N', 'Functions: N'
+          and 'Traces: N' counts
+        - "warnings": lines under a '⚠ ... warnings:' header (indented)
+          plus standalone lines containing 'warning:'
+        - "errors": lines containing an error marker ('error', 'Error', '✗')
+        - "coverage": first percentage on a 'coverage:' line (e.g.
+          'Traceability Coverage: 85.0%'), 0.0 if absent
+        - "total_traces": number of 'from → to' matrix lines, falling back
+          to the 'Traces: N' metric, 0 if absent
+        - "issues": indented lines under an '... issues found:' header
         """
-        warnings = []
+        metrics: Dict[str, int] = {}
+        warnings: List[str] = []
+        errors: List[str] = []
+        issues: List[str] = []
+        coverage: Optional[float] = None
+        matrix_lines = 0
         in_warning_block = False
-        for line in output.split("\n"):
-            if "warnings:" in line.lower():
+        in_issue_block = False
+        add_warning = warnings.append
+        add_error = errors.append
+        add_issue = issues.append
+
+        for line in output.splitlines():
+            lower = line.lower()
+            stripped = line.strip()
+            indented = line.startswith("  ") and bool(stripped)
+
+            match = METRIC_RE.match(line)
+            if match:
+                metrics[match.group(1).lower()] = int(match.group(2))
+
+            if "warnings:" in lower:
                 in_warning_block = True
-                continue
-            if in_warning_block:
-                if line.startswith("  ") and line.strip():
-                    warnings.append(line.strip())
-                    continue
+            elif in_warning_block and indented:
+                add_warning(stripped)
+            else:
                 in_warning_block = False
-            if "warning:" in line.lower():
-                warnings.append(line.strip())
-        return warnings
+                if "warning:" in lower:
+                    add_warning(stripped)
 
-    def _parse_errors(self, stderr: str, stdout: str = "") -> List[str]:
-        """Parse errors from compiler output.
+            if "issues found:" in lower:
+                in_issue_block = True
+            elif in_issue_block:
+                if indented:
+                    add_issue(stripped)
+                else:
+                    in_issue_block = False
 
-        Only lines containing an error marker ('error', 'Error', '✗')
-        are treated as errors; the full stdout is preserved separately
-        by callers in "raw_output".
-        """
-        errors = []
-        for source in (stderr, stdout):
-            for line in source.split("\n"):
-                if any(marker in line for marker in ERROR_MARKERS):
-                    errors.append(line.strip())
-        return errors
-
-    def _parse_coverage(self, output: str) -> float:
-        """Parse coverage percentage (the CLI prints e.g. 'Traceability Coverage: 85.0%')."""
-        for line in output.split("\n"):
-            if "coverage:" in line.lower():
-                match = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*%", line)
+            if any(marker in line for marker in ERROR_MARKERS):
+                add_error(stripped)
+
+            if coverage is None and "coverage:" in lower:
+                match = COVERAGE_RE.search(line)
                 if match:
-                    return float(match.group(1))
-        return 0.0
+                    coverage = float(match.group(1))
 
-    def _count_traces(self, output: str) -> int:
-        """Count total traces.
+            if " → " in line:
+                matrix_lines += 1
 
-        With `--matrix` the CLI prints one 'from → to' line per trace;
-        otherwise fall back to a 'Traces: N' line if present.
-        """
-        matrix_lines = [line for line in output.split("\n") if " → " in line]
-        if matrix_lines:
-            return len(matrix_lines)
-        for line in output.split("\n"):
-            if "Traces:" in line or "traces:" in line:
-                value = self._parse_int(line)
-                if value is not None:
-                    return value
-        return 0
-
-    def _parse_trace_issues(self, output: str) -> List[str]:
-        """Parse traceability issues printed by `trace --validate`.
-
-        The CLI prints '⚠ Traceability issues found:' followed by
-        indented issue lines.
+        return {
+            "metrics": metrics,
+            "warnings": warnings,
+            "errors": errors,
+            "coverage": coverage if coverage is not None else 0.0,
+            "total_traces": matrix_lines or metrics.get("traces", 0),
+            "issues": issues,
+        }
+
+    def _parse_errors(self, stderr: str) -> List[str]:
+        """Parse errors from compiler stderr.
+
+        Only lines containing an error marker ('error', 'Error', '✗')
+        are treated as errors; stdout errors come from `_parse_all` and
+        the full stdout is preserved separately by callers in "raw_output".
         """
-        issues = []
-        in_issue_block = False
-        for line in output.split("\n"):
-            if "issues found:" in line.lower():
-                in_issue_block = True
-                continue
-            if in_issue_block:
-                if line.startswith("  ") and line.strip():
-                    issues.append(line.strip())
-                else:
-                    in_issue_block = False
-        return issues
+        return [
+            line.strip()
+            for line in stderr.splitlines()
+            if any(marker in line for marker in ERROR_MARKERS)
+        ]
 
     def _parse_element_count(self, output: str, diagram_type: str) -> str:
         """Parse element count from CLI output."""
-        patterns = {
-            "operational": r"Activities: (\d+)",
-            "functional": r"Functions: (\d+)",
-            "component": r"Components: (\d+)",
-            "sequence": r"Messages: (\d+)",
-            "state-machine": r"States: (\d+)",
-            "physical": r"Nodes: (\d+)",
-            "class": r"Classes: (\d+)",
-            "tree": r"Nodes: (\d+)",
-            "capability": r"Capabilities: (\d+)",
-            "functional-chain": r"Functions: (\d+)"
-        }
-
-        pattern = patterns.get(diagram_type)
+        pattern = ELEMENT_COUNT_RES.get(diagram_type)
         if pattern:
-            match = re.search(pattern, output)
+            match = pattern.search(output)
             if match:
                 return match.group(1)
 
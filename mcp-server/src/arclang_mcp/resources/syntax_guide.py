@@ -3,7 +3,9 @@ ArcLang Syntax Guide Resource for MCP Server.
 This resource is exposed to AI clients to enforce correct syntax.
 """
 
-ARCLANG_SYNTAX_RULES = """
+from typing import Final
+
+ARCLANG_SYNTAX_RULES: Final[str] = """
 # ArcLang Syntax Rules - MANDATORY FOR ALL AI CLIENTS
 
 ## Model Declaration (REQUIRED FORMAT)
@@ -59,5 +61,9 @@ ALL GENERATED CODE WILL BE VALIDATED. FOLLOW THESE RULES EXACTLY.
 """
 
 def get_syntax_rules() -> str:
-    """Return the mandatory syntax rules for AI clients."""
+    """Return the mandatory syntax rules for AI clients.
+
+    The module constant is returned as-is (no copy or re-encoding); the MCP
+    SDK serializes it as text resource contents.
+    """
     return ARCLANG_SYNTAX_RULES
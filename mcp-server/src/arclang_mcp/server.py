@@ -3,9 +3,10 @@ Main MCP Server implementation for ArcLang.
 """
 
 import asyncio
+import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, Resource
@@ -16,11 +17,26 @@ from .tools.generation import GenerationTools
 from .tools.safety import SafetyTools
 from .tools.integration import IntegrationTools
 from .compiler.wrapper import ArcLangCompiler
+from .ai.generator import close_clients
 from .utils.config import load_config
+from .utils.serialization import dumps_json
 from .mbse_expert import MBSECapellaExpert
 
 logger = logging.getLogger(__name__)
 
+# inputSchema properties shared by reference across the tool listing
+_MODEL_PATH_PROP = {
+    "type": "string",
+    "description": "Path to .arc model file"
+}
+_MODEL_PATH_OR_DIR_PROP = {
+    "type": "string",
+    "description": "Path to .arc model file or directory"
+}
+
+# Default parallelism for arclang_batch_execute.
+DEFAULT_BATCH_CONCURRENCY = 4
+
 
 class ArcLangMCPServer:
     """MCP Server for ArcLang MBSE platform."""
@@ -45,6 +61,32 @@ class ArcLangMCPServer:
         # Initialize MBSE expert system
         self.mbse_expert = MBSECapellaExpert(self.workspace_root)
         
+        # Tool name -> tool group that executes it
+        self._routes = {
+            name: group
+            for group in (
+                self.core_tools,
+                self.generation_tools,
+                self.safety_tools,
+                self.integration_tools,
+            )
+            for name in group.TOOL_NAMES
+        }
+        
+        # Tools implemented directly on the server
+        self._server_tools = {
+            "arclang_batch_execute": self._batch_execute,
+            "arclang_execute_batch": self._execute_batch,
+            "arclang_analyze_requirements": self._analyze_requirements,
+            "arclang_generate_from_requirements": self._generate_from_requirements,
+            "arclang_assess_diagram_quality": self._assess_diagram_quality,
+            "arclang_suggest_diagram_enhancements": self._suggest_diagram_enhancements,
+            "arclang_generate_mbse_report": self._generate_mbse_report,
+        }
+        
+        # Rendered syntax rules, filled on the first resource read
+        self._syntax_rules_cache: Optional[str] = None
+        
         # Create MCP server
         self.server = Server("arclang-mcp")
         self._register_tools()
@@ -52,231 +94,218 @@ class ArcLangMCPServer:
     def _register_tools(self) -> None:
         """Register all available tools and resources with the MCP server."""
         
-        # Register syntax rules as a resource
+        # Register syntax rules as a resource. Resource and tool listings are
+        # static for the server's lifetime, so they are built once here.
+        self._resources_cache: List[Resource] = [
+            Resource(
+                uri="arclang://syntax-rules",
+                name="ArcLang Syntax Rules",
+                description="Mandatory syntax rules for generating ArcLang models. AI clients MUST follow these rules.",
+                mimeType="text/markdown"
+            )
+        ]
+
         @self.server.list_resources()
         async def list_resources() -> List[Resource]:
             """List available resources including syntax rules."""
-            return [
-                Resource(
-                    uri="arclang://syntax-rules",
-                    name="ArcLang Syntax Rules",
-                    description="Mandatory syntax rules for generating ArcLang models. AI clients MUST follow these rules.",
-                    mimeType="text/markdown"
-                )
-            ]
+            return self._resources_cache
         
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read resource content."""
             if uri == "arclang://syntax-rules":
-                return get_syntax_rules()
+                if self._syntax_rules_cache is None:
+                    self._syntax_rules_cache = get_syntax_rules()
+                return self._syntax_rules_cache
             raise ValueError(f"Unknown resource: {uri}")
         
         # Core tools
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            """List all available tools."""
-            return [
-                # Core compilation and validation
-                Tool(
-                    name="arclang_compile",
-                    description="Compile ArcLang model to Capella XML format. Validates syntax and semantics.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "validate": {
-                                "type": "boolean",
-                                "description": "Run validation checks",
-                                "default": True
-                            },
-                            "optimize": {
-                                "type": "boolean",
-                                "description": "Enable optimizations",
-                                "default": False
-                            }
-                        },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_validate",
-                    description="Validate ArcLang model syntax and semantics without compilation.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "strict": {
-                                "type": "boolean",
-                                "description": "Enable strict validation mode",
-                                "default": False
-                            }
-                        },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_trace_analysis",
-                    description="Analyze traceability coverage and find gaps in requirements/component traces.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file or directory"
-                            },
-                            "show_gaps": {
-                                "type": "boolean",
-                                "description": "Show untraced elements",
-                                "default": True
-                            },
-                            "matrix": {
-                                "type": "boolean",
-                                "description": "Generate traceability matrix",
-                                "default": False
-                            }
+        self._tools_cache: List[Tool] = [
+            # Core compilation and validation
+            Tool(
+                name="arclang_compile",
+                description="Compile ArcLang model to Capella XML format. Validates syntax and semantics.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "validate": {
+                            "type": "boolean",
+                            "description": "Run validation checks",
+                            "default": True
                         },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_export_diagram",
-                    description="Generate architecture diagram from ArcLang model.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "format": {
-                                "type": "string",
-                                "enum": ["capella", "json", "yaml", "xml", "markdown", "html", "pdf"],
-                                "description": "Output diagram format",
-                                "default": "html"
-                            },
-                            "output_path": {
-                                "type": "string",
-                                "description": "Output file path"
-                            }
+                        "optimize": {
+                            "type": "boolean",
+                            "description": "Enable optimizations",
+                            "default": False
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_validate",
+                description="Validate ArcLang model syntax and semantics without compilation.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "strict": {
+                            "type": "boolean",
+                            "description": "Enable strict validation mode",
+                            "default": False
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_trace_analysis",
+                description="Analyze traceability coverage and find gaps in requirements/component traces.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_OR_DIR_PROP,
+                        "show_gaps": {
+                            "type": "boolean",
+                            "description": "Show untraced elements",
+                            "default": True
                         },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_info",
-                    description="Get model metrics and statistics (requirements count, components, coverage, etc.).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file or directory"
-                            },
-                            "detailed": {
-                                "type": "boolean",
-                                "description": "Include detailed metrics",
-                                "default": False
-                            }
+                        "matrix": {
+                            "type": "boolean",
+                            "description": "Generate traceability matrix",
+                            "default": False
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_export_diagram",
+                description="Generate architecture diagram from ArcLang model.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "format": {
+                            "type": "string",
+                            "enum": ["capella", "json", "yaml", "xml", "markdown", "html", "pdf"],
+                            "description": "Output diagram format",
+                            "default": "html"
                         },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                # Generation tools
-                Tool(
-                    name="arclang_generate_requirement",
-                    description="""Generate ArcLang requirement from natural language description.
+                        "output_path": {
+                            "type": "string",
+                            "description": "Output file path"
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_info",
+                description="Get model metrics and statistics (requirements count, components, coverage, etc.).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_OR_DIR_PROP,
+                        "detailed": {
+                            "type": "boolean",
+                            "description": "Include detailed metrics",
+                            "default": False
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            # Generation tools
+            Tool(
+                name="arclang_generate_requirement",
+                description="""Generate ArcLang requirement from natural language description.
                     
 MANDATORY SYNTAX: Use 'req ID \"Title\" { }' format inside 'requirements stakeholder/system/safety { }' block.
 CORRECT: requirements stakeholder { req STK-001 \"Title\" { description: \"Text\" } }
 WRONG: requirement \"REQ-001\" { } or req { id: \"REQ-001\" }""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "description": {
-                                "type": "string",
-                                "description": "Natural language description of requirement"
-                            },
-                            "safety_level": {
-                                "type": "string",
-                                "enum": ["ASIL_A", "ASIL_B", "ASIL_C", "ASIL_D", "DAL_A", "DAL_B", "DAL_C", "DAL_D", "SIL_1", "SIL_2", "SIL_3", "SIL_4"],
-                                "description": "Safety integrity level"
-                            },
-                            "priority": {
-                                "type": "string",
-                                "enum": ["Critical", "High", "Medium", "Low"],
-                                "description": "Requirement priority",
-                                "default": "High"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "description": {
+                            "type": "string",
+                            "description": "Natural language description of requirement"
                         },
-                        "required": ["description"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_generate_component",
-                    description="""Generate ArcLang component architecture from description.
+                        "safety_level": {
+                            "type": "string",
+                            "enum": ["ASIL_A", "ASIL_B", "ASIL_C", "ASIL_D", "DAL_A", "DAL_B", "DAL_C", "DAL_D", "SIL_1", "SIL_2", "SIL_3", "SIL_4"],
+                            "description": "Safety integrity level"
+                        },
+                        "priority": {
+                            "type": "string",
+                            "enum": ["Critical", "High", "Medium", "Low"],
+                            "description": "Requirement priority",
+                            "default": "High"
+                        }
+                    },
+                    "required": ["description"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_generate_component",
+                description="""Generate ArcLang component architecture from description.
                     
 MANDATORY SYNTAX: Use 'component Name \"Display\" { }' inside 'architecture logical/physical { }' block.
 CORRECT: component SensorSubsystem \"Sensor\" { provides interface IData { } }
 WRONG: component \"Name\" { port \"input\" { } } or component { name: \"Name\" }""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "description": {
-                                "type": "string",
-                                "description": "Natural language description of component"
-                            },
-                            "component_type": {
-                                "type": "string",
-                                "enum": ["Logical", "Physical", "Operational"],
-                                "description": "Component type",
-                                "default": "Logical"
-                            },
-                            "safety_level": {
-                                "type": "string",
-                                "description": "Safety integrity level (optional)"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "description": {
+                            "type": "string",
+                            "description": "Natural language description of component"
                         },
-                        "required": ["description"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_suggest_architecture",
-                    description="Get AI-powered architecture suggestions based on requirements.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "requirements": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of requirement descriptions"
-                            },
-                            "domain": {
-                                "type": "string",
-                                "enum": ["automotive", "aerospace", "defense", "industrial"],
-                                "description": "Application domain"
-                            }
+                        "component_type": {
+                            "type": "string",
+                            "enum": ["Logical", "Physical", "Operational"],
+                            "description": "Component type",
+                            "default": "Logical"
                         },
-                        "required": ["requirements"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_generate_diagram",
-                    description="""Generate a specific Capella diagram type from ArcLang model.
+                        "safety_level": {
+                            "type": "string",
+                            "description": "Safety integrity level (optional)"
+                        }
+                    },
+                    "required": ["description"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_suggest_architecture",
+                description="Get AI-powered architecture suggestions based on requirements.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "requirements": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "List of requirement descriptions"
+                        },
+                        "domain": {
+                            "type": "string",
+                            "enum": ["automotive", "aerospace", "defense", "industrial"],
+                            "description": "Application domain"
+                        }
+                    },
+                    "required": ["requirements"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_generate_diagram",
+                description="""Generate a specific Capella diagram type from ArcLang model.
 
 Supports all 10 diagram types with rich content:
 - operational: Swimlane activity diagrams with actors (⊕ symbols)
@@ -291,32 +320,29 @@ Supports all 10 diagram types with rich content:
 - functional-chain: Execution flow scenarios
 
 All diagrams use professional Capella-quality rendering.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "diagram_type": {
-                                "type": "string",
-                                "enum": ["operational", "functional", "component", "sequence",
-                                        "state-machine", "physical", "class", "tree",
-                                        "capability", "functional-chain"],
-                                "description": "Type of diagram to generate"
-                            },
-                            "output_path": {
-                                "type": "string",
-                                "description": "Output SVG file path (optional)"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "diagram_type": {
+                            "type": "string",
+                            "enum": ["operational", "functional", "component", "sequence",
+                                    "state-machine", "physical", "class", "tree",
+                                    "capability", "functional-chain"],
+                            "description": "Type of diagram to generate"
                         },
-                        "required": ["model_path", "diagram_type"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_generate_all_diagrams",
-                    description="""Generate all 10 Capella diagram types from ArcLang model.
+                        "output_path": {
+                            "type": "string",
+                            "description": "Output SVG file path (optional)"
+                        }
+                    },
+                    "required": ["model_path", "diagram_type"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_generate_all_diagrams",
+                description="""Generate all 10 Capella diagram types from ArcLang model.
 
 Creates complete professional diagram set:
 - 10 SVG diagrams with rich content (3-13x larger than simple)
@@ -325,98 +351,89 @@ Creates complete professional diagram set:
 - Summary report with success/failure status
 
 Average: 127KB total content, 12.7KB per diagram.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "output_dir": {
-                                "type": "string",
-                                "description": "Output directory for all diagrams",
-                                "default": "./diagrams"
-                            }
-                        },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                # Safety tools
-                Tool(
-                    name="arclang_safety_check",
-                    description="Validate model against safety standards (ISO 26262, DO-178C, IEC 61508).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "standard": {
-                                "type": "string",
-                                "enum": ["iso26262", "do178c", "iec61508"],
-                                "description": "Safety standard to validate against"
-                            },
-                            "generate_report": {
-                                "type": "boolean",
-                                "description": "Generate detailed HTML report",
-                                "default": False
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "output_dir": {
+                            "type": "string",
+                            "description": "Output directory for all diagrams",
+                            "default": "./diagrams"
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            # Safety tools
+            Tool(
+                name="arclang_safety_check",
+                description="Validate model against safety standards (ISO 26262, DO-178C, IEC 61508).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "standard": {
+                            "type": "string",
+                            "enum": ["iso26262", "do178c", "iec61508"],
+                            "description": "Safety standard to validate against"
                         },
-                        "required": ["model_path", "standard"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_hazard_analysis",
-                    description="Perform HARA (Hazard Analysis and Risk Assessment) on model.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "model_path": {
-                                "type": "string",
-                                "description": "Path to .arc model file"
-                            },
-                            "standard": {
-                                "type": "string",
-                                "enum": ["iso26262", "iec61508"],
-                                "description": "Safety standard",
-                                "default": "iso26262"
-                            }
+                        "generate_report": {
+                            "type": "boolean",
+                            "description": "Generate detailed HTML report",
+                            "default": False
+                        }
+                    },
+                    "required": ["model_path", "standard"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_hazard_analysis",
+                description="Perform HARA (Hazard Analysis and Risk Assessment) on model.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "model_path": _MODEL_PATH_PROP,
+                        "standard": {
+                            "type": "string",
+                            "enum": ["iso26262", "iec61508"],
+                            "description": "Safety standard",
+                            "default": "iso26262"
+                        }
+                    },
+                    "required": ["model_path"]
+                }
+            ),
+            
+            # Integration tools
+            Tool(
+                name="arclang_git_merge",
+                description="Semantic merge assistance for ArcLang models (resolves conflicts by component ID).",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "base_path": {
+                            "type": "string",
+                            "description": "Path to base version"
                         },
-                        "required": ["model_path"]
-                    }
-                ),
-                
-                # Integration tools
-                Tool(
-                    name="arclang_git_merge",
-                    description="Semantic merge assistance for ArcLang models (resolves conflicts by component ID).",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "base_path": {
-                                "type": "string",
-                                "description": "Path to base version"
-                            },
-                            "ours_path": {
-                                "type": "string",
-                                "description": "Path to our version"
-                            },
-                            "theirs_path": {
-                                "type": "string",
-                                "description": "Path to their version"
-                            }
+                        "ours_path": {
+                            "type": "string",
+                            "description": "Path to our version"
                         },
-                        "required": ["base_path", "ours_path", "theirs_path"]
-                    }
-                ),
-                
-                # MBSE Expert tools
-                Tool(
-                    name="arclang_analyze_requirements",
-                    description="""MBSE Expert: Analyze natural language requirements and map to Arcadia layers.
+                        "theirs_path": {
+                            "type": "string",
+                            "description": "Path to their version"
+                        }
+                    },
+                    "required": ["base_path", "ours_path", "theirs_path"]
+                }
+            ),
+            
+            # MBSE Expert tools
+            Tool(
+                name="arclang_analyze_requirements",
+                description="""MBSE Expert: Analyze natural language requirements and map to Arcadia layers.
                     
 This tool acts as a Capella methodology expert, analyzing user requirements to:
 - Identify which Arcadia layer each requirement belongs to (Operational/System/Logical/Physical/EPBS)
@@ -427,27 +444,27 @@ This tool acts as a Capella methodology expert, analyzing user requirements to:
 - Recommend architecture patterns based on domain
 
 Returns comprehensive analysis with Arcadia mapping and recommendations.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "requirements_text": {
-                                "type": "string",
-                                "description": "Natural language requirements (one per line or paragraph)"
-                            },
-                            "domain": {
-                                "type": "string",
-                                "enum": ["automotive", "aerospace", "defense", "industrial", "general"],
-                                "description": "Application domain for context-aware analysis",
-                                "default": "automotive"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "requirements_text": {
+                            "type": "string",
+                            "description": "Natural language requirements (one per line or paragraph)"
                         },
-                        "required": ["requirements_text"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_generate_from_requirements",
-                    description="""MBSE Expert: Generate complete ArcLang model from requirement analysis.
+                        "domain": {
+                            "type": "string",
+                            "enum": ["automotive", "aerospace", "defense", "industrial", "general"],
+                            "description": "Application domain for context-aware analysis",
+                            "default": "automotive"
+                        }
+                    },
+                    "required": ["requirements_text"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_generate_from_requirements",
+                description="""MBSE Expert: Generate complete ArcLang model from requirement analysis.
                     
 Takes requirement analysis and generates syntactically correct .arc file with:
 - Stakeholder requirements (STK-XXX)
@@ -460,29 +477,29 @@ Takes requirement analysis and generates syntactically correct .arc file with:
 - Complete traceability chains
 
 Output is production-ready ArcLang code following best practices.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "analysis": {
-                                "type": "object",
-                                "description": "Requirement analysis from arclang_analyze_requirements"
-                            },
-                            "project_name": {
-                                "type": "string",
-                                "description": "Name of the project/system"
-                            },
-                            "output_path": {
-                                "type": "string",
-                                "description": "Path to save generated .arc file"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "analysis": {
+                            "type": "object",
+                            "description": "Requirement analysis from arclang_analyze_requirements"
                         },
-                        "required": ["analysis", "project_name"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_assess_diagram_quality",
-                    description="""MBSE Expert: Assess Capella diagram quality against best practices.
+                        "project_name": {
+                            "type": "string",
+                            "description": "Name of the project/system"
+                        },
+                        "output_path": {
+                            "type": "string",
+                            "description": "Path to save generated .arc file"
+                        }
+                    },
+                    "required": ["analysis", "project_name"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_assess_diagram_quality",
+                description="""MBSE Expert: Assess Capella diagram quality against best practices.
                     
 Evaluates generated diagrams for Capella compliance:
 - Checks required elements (interfaces, protocols, actors, etc.)
@@ -493,28 +510,28 @@ Evaluates generated diagrams for Capella compliance:
 - Provides quality score (0-100%) per check
 
 Returns detailed assessment with specific improvement recommendations.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "diagram_path": {
-                                "type": "string",
-                                "description": "Path to SVG diagram file"
-                            },
-                            "diagram_type": {
-                                "type": "string",
-                                "enum": ["operational", "functional", "component", "sequence", 
-                                        "state-machine", "physical", "class", "tree", 
-                                        "capability", "functional-chain"],
-                                "description": "Type of diagram to assess"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "diagram_path": {
+                            "type": "string",
+                            "description": "Path to SVG diagram file"
                         },
-                        "required": ["diagram_path", "diagram_type"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_suggest_diagram_enhancements",
-                    description="""MBSE Expert: Suggest specific enhancements for diagram quality.
+                        "diagram_type": {
+                            "type": "string",
+                            "enum": ["operational", "functional", "component", "sequence", 
+                                    "state-machine", "physical", "class", "tree", 
+                                    "capability", "functional-chain"],
+                            "description": "Type of diagram to assess"
+                        }
+                    },
+                    "required": ["diagram_path", "diagram_type"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_suggest_diagram_enhancements",
+                description="""MBSE Expert: Suggest specific enhancements for diagram quality.
                     
 Based on quality assessment, suggests concrete enhancements:
 - Missing Capella notation elements
@@ -524,21 +541,21 @@ Based on quality assessment, suggests concrete enhancements:
 - Prioritized by impact on quality score
 
 Returns actionable enhancement list ready for batch execution.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "assessment": {
-                                "type": "object",
-                                "description": "Quality assessment from arclang_assess_diagram_quality"
-                            }
-                        },
-                        "required": ["assessment"]
-                    }
-                ),
-                
-                Tool(
-                    name="arclang_generate_mbse_report",
-                    description="""MBSE Expert: Generate comprehensive MBSE quality report.
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "assessment": {
+                            "type": "object",
+                            "description": "Quality assessment from arclang_assess_diagram_quality"
+                        }
+                    },
+                    "required": ["assessment"]
+                }
+            ),
+            
+            Tool(
+                name="arclang_generate_mbse_report",
+                description="""MBSE Expert: Generate comprehensive MBSE quality report.
                     
 Produces professional markdown report with:
 - Requirements analysis summary
@@ -550,31 +567,31 @@ Produces professional markdown report with:
 - Capella compliance assessment
 
 Perfect for technical reviews and documentation.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "analysis": {
-                                "type": "object",
-                                "description": "Requirement analysis results"
-                            },
-                            "assessments": {
-                                "type": "array",
-                                "items": {"type": "object"},
-                                "description": "List of diagram quality assessments"
-                            },
-                            "output_path": {
-                                "type": "string",
-                                "description": "Path to save report (optional)"
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "analysis": {
+                            "type": "object",
+                            "description": "Requirement analysis results"
                         },
-                        "required": ["analysis"]
-                    }
-                ),
-                
-                # Code execution tool for efficient batching
-                Tool(
-                    name="arclang_execute_batch",
-                    description="""Execute multiple ArcLang operations in a single efficient batch.
+                        "assessments": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "List of diagram quality assessments"
+                        },
+                        "output_path": {
+                            "type": "string",
+                            "description": "Path to save report (optional)"
+                        }
+                    },
+                    "required": ["analysis"]
+                }
+            ),
+            
+            # Code execution tool for efficient batching
+            Tool(
+                name="arclang_execute_batch",
+                description="""Execute multiple ArcLang operations in a single efficient batch.
 
 This tool enables "code mode" execution where the AI agent can:
 - Load and filter model data BEFORE sending to LLM context
@@ -591,91 +608,197 @@ Example operations:
 5. refactor_component: Rename component across model, validate, return change count
 
 Each operation executes fully server-side. Only filtered results sent to LLM.""",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "operations": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "action": {
-                                            "type": "string",
-                                            "enum": [
-                                                "compile_and_validate",
-                                                "generate_all_diagrams",
-                                                "analyze_traceability",
-                                                "safety_check",
-                                                "extract_metrics",
-                                                "export_filtered",
-                                                "compare_models",
-                                                "analyze_diagrams",
-                                                "enhance_diagram"
-                                            ],
-                                            "description": "Operation to perform"
-                                        },
-                                        "params": {
-                                            "type": "object",
-                                            "description": "Parameters for the operation"
-                                        },
-                                        "filter": {
-                                            "type": "object",
-                                            "description": "Optional filter to apply to results (e.g., {\"only_errors\": true, \"max_items\": 10})"
-                                        }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "action": {
+                                        "type": "string",
+                                        "enum": [
+                                            "compile_and_validate",
+                                            "generate_all_diagrams",
+                                            "analyze_traceability",
+                                            "safety_check",
+                                            "extract_metrics",
+                                            "export_filtered",
+                                            "compare_models",
+                                            "analyze_diagrams",
+                                            "enhance_diagram"
+                                        ],
+                                        "description": "Operation to perform"
+                                    },
+                                    "params": {
+                                        "type": "object",
+                                        "description": "Parameters for the operation"
                                     },
-                                    "required": ["action", "params"]
+                                    "filter": {
+                                        "type": "object",
+                                        "description": "Optional filter to apply to results (e.g., {\"only_errors\": true, \"max_items\": 10})"
+                                    }
                                 },
-                                "description": "List of operations to execute in sequence"
+                                "required": ["action", "params"]
                             },
-                            "stop_on_error": {
-                                "type": "boolean",
-                                "description": "Stop batch execution if any operation fails",
-                                "default": False
+                            "description": "List of operations to execute in sequence"
+                        },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Stop batch execution if any operation fails",
+                            "default": False
+                        },
+                        "return_summary_only": {
+                            "type": "boolean",
+                            "description": "Return only summary statistics instead of full results",
+                            "default": False
+                        }
+                    },
+                    "required": ["operations"]
+                }
+            ),
+
+            # Concurrent fan-out of regular tool calls
+            Tool(
+                name="arclang_batch_execute",
+                description="""Run several ArcLang tool calls concurrently in one request.
+
+Each operation names any other tool and its arguments, e.g. compile, validate
+and trace the same model in a single round-trip. Results are returned as a
+JSON array in operation order; if the request carries a progress token, a
+progress notification is sent as each call finishes.""",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {
+                                        "type": "string",
+                                        "description": "Tool name (e.g. arclang_compile)"
+                                    },
+                                    "arguments": {
+                                        "type": "object",
+                                        "description": "Arguments for the tool"
+                                    }
+                                },
+                                "required": ["name"]
                             },
-                            "return_summary_only": {
-                                "type": "boolean",
-                                "description": "Return only summary statistics instead of full results",
-                                "default": False
-                            }
+                            "description": "Tool calls to run"
                         },
-                        "required": ["operations"]
-                    }
-                ),
-            ]
+                        "max_concurrent": {
+                            "type": "integer",
+                            "description": "Maximum number of tool calls running at once",
+                            "default": DEFAULT_BATCH_CONCURRENCY
+                        },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Skip operations that have not started once one fails",
+                            "default": False
+                        }
+                    },
+                    "required": ["operations"]
+                }
+            ),
+        ]
+
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            """List all available tools."""
+            return self._tools_cache
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent | ImageContent]:
             """Execute a tool with given arguments."""
+            # Arguments can be large (batches, requirement text); only encode
+            # them when debug logging is actually on.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling tool %s with arguments %s", name, dumps_json(arguments))
             try:
-                # Route to appropriate tool handler
-                if name == "arclang_execute_batch":
-                    result = await self._execute_batch(arguments)
-                elif name == "arclang_analyze_requirements":
-                    result = await self._analyze_requirements(arguments)
-                elif name == "arclang_generate_from_requirements":
-                    result = await self._generate_from_requirements(arguments)
-                elif name == "arclang_assess_diagram_quality":
-                    result = await self._assess_diagram_quality(arguments)
-                elif name == "arclang_suggest_diagram_enhancements":
-                    result = await self._suggest_diagram_enhancements(arguments)
-                elif name == "arclang_generate_mbse_report":
-                    result = await self._generate_mbse_report(arguments)
-                elif name.startswith("arclang_compile") or name in ["arclang_validate", "arclang_trace_analysis", "arclang_export_diagram", "arclang_info"]:
-                    result = await self.core_tools.execute(name, arguments)
-                elif name.startswith("arclang_generate") or name == "arclang_suggest_architecture":
-                    result = await self.generation_tools.execute(name, arguments)
-                elif name.startswith("arclang_safety") or name == "arclang_hazard_analysis":
-                    result = await self.safety_tools.execute(name, arguments)
-                elif name.startswith("arclang_git") or name.startswith("arclang_plm"):
-                    result = await self.integration_tools.execute(name, arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
+                result = await self._dispatch(name, arguments)
                 return [TextContent(type="text", text=result)]
             
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}")
+                logger.error("Error executing tool %s: %s", name, e, exc_info=True)
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+    async def _dispatch(self, name: str, arguments: Dict[str, Any]) -> str:
+        """Route a tool call to its handler and return the text result."""
+        handler = self._server_tools.get(name)
+        if handler is not None:
+            return await handler(arguments)
+
+        group = self._routes.get(name)
+        if group is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await group.execute(name, arguments)
+
+    async def _batch_execute(self, arguments: Dict[str, Any]) -> str:
+        """
+        Run several tool calls concurrently and return their results as JSON.
+
+        Calls are bounded by `max_concurrent`; with `stop_on_error`, calls
+        that have not started when one fails are reported as skipped. The
+        MCP SDK returns a tool result only once, so when the client asked for
+        progress each finished call is reported as it completes.
+        """
+        operations = arguments.get("operations", [])
+        report = self._progress_reporter()
+        total = len(operations)
+        completed = 0
+        max_concurrent = max(1, arguments.get("max_concurrent", DEFAULT_BATCH_CONCURRENCY))
+        stop_on_error = arguments.get("stop_on_error", False)
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+        failed = asyncio.Event()
+
+        async def run(index: int, op: Dict[str, Any]) -> Dict[str, Any]:
+            name = op.get("name", "")
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    return {"operation": index, "name": name, "status": "skipped"}
+                try:
+                    if name == "arclang_batch_execute":
+                        raise ValueError("arclang_batch_execute cannot be nested")
+                    result = await self._dispatch(name, op.get("arguments", {}))
+                except Exception as e:
+                    failed.set()
+                    return {"operation": index, "name": name, "status": "error", "error": str(e)}
+                return {"operation": index, "name": name, "status": "success", "result": result}
+
+        async def run_and_report(index: int, op: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            entry = await run(index, op)
+            completed += 1
+            if report is not None:
+                await report(completed, total)
+            return entry
+
+        results = await asyncio.gather(
+            *(run_and_report(i, op) for i, op in enumerate(operations, 1))
+        )
+        return dumps_json(list(results))
+
+    def _progress_reporter(self) -> Optional[Callable[[int, int], Awaitable[None]]]:
+        """Return a progress callback for the current request, or None if not requested."""
+        try:
+            ctx = self.server.request_context
+        except LookupError:
+            return None
+        token = ctx.meta.progressToken if ctx.meta is not None else None
+        if token is None:
+            return None
+
+        async def report(progress: int, total: int) -> None:
+            try:
+                await ctx.session.send_progress_notification(token, progress, total)
+            except Exception as e:
+                logger.debug("Progress notification failed: %s", e)
+
+        return report
     
     async def _execute_batch(self, arguments: Dict[str, Any]) -> str:
         """
@@ -684,7 +807,6 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
         This enables "code mode" where complex operations run server-side,
         filtering data before sending to LLM context.
         """
-        import json
         from pathlib import Path
         
         operations = arguments.get("operations", [])
@@ -704,11 +826,11 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
                 if action == "compile_and_validate":
                     model_path = params.get("model_path")
                     
-                    # Compile
-                    compile_result = await self.core_tools.execute("arclang_compile", {"model_path": model_path})
-                    
-                    # Validate
-                    validate_result = await self.core_tools.execute("arclang_validate", {"model_path": model_path})
+                    # Compile and validate are independent, so run them together
+                    compile_result, validate_result = await self.core_tools.execute_many([
+                        ("arclang_compile", {"model_path": model_path}),
+                        ("arclang_validate", {"model_path": model_path}),
+                    ])
                     
                     # Filter: only return errors/warnings if any
                     if filter_config.get("only_errors", True):
@@ -847,8 +969,10 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
                     model2_path = params.get("model2_path")
                     
                     # Load both models
-                    info1 = await self.core_tools.execute("arclang_info", {"model_path": model1_path})
-                    info2 = await self.core_tools.execute("arclang_info", {"model_path": model2_path})
+                    info1, info2 = await self.core_tools.execute_many([
+                        ("arclang_info", {"model_path": model1_path}),
+                        ("arclang_info", {"model_path": model2_path}),
+                    ])
                     
                     # Simple diff comparison
                     result = {
@@ -1052,24 +1176,22 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
                 "tokens_saved_estimate": total_tokens_saved,
                 "operations": [{"action": r["action"], "status": r["status"]} for r in results]
             }
-            return json.dumps(summary, indent=2)
+            return dumps_json(summary)
         else:
-            return json.dumps({
+            return dumps_json({
                 "results": results,
                 "tokens_saved_estimate": total_tokens_saved
-            }, indent=2)
+            })
     
     async def _analyze_requirements(self, arguments: Dict[str, Any]) -> str:
         """Analyze requirements using MBSE expert system."""
-        import json
-        
         requirements_text = arguments.get("requirements_text", "")
         domain = arguments.get("domain", "automotive")
         
         analysis = self.mbse_expert.analyze_requirements(requirements_text)
         analysis["domain"] = domain
         
-        return json.dumps(analysis, indent=2)
+        return dumps_json(analysis)
     
     async def _generate_from_requirements(self, arguments: Dict[str, Any]) -> str:
         """Generate ArcLang model from requirements analysis."""
@@ -1093,8 +1215,6 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
     
     async def _assess_diagram_quality(self, arguments: Dict[str, Any]) -> str:
         """Assess diagram quality using MBSE expert system."""
-        import json
-        
         diagram_path = arguments.get("diagram_path", "")
         diagram_type = arguments.get("diagram_type", "component")
         
@@ -1104,20 +1224,18 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
         
         assessment = self.mbse_expert.assess_diagram_quality(resolved_path, diagram_type)
         
-        return json.dumps(assessment, indent=2)
+        return dumps_json(assessment)
     
     async def _suggest_diagram_enhancements(self, arguments: Dict[str, Any]) -> str:
         """Suggest diagram enhancements based on quality assessment."""
-        import json
-        
         assessment = arguments.get("assessment", {})
         
         enhancements = self.mbse_expert.suggest_enhancements(assessment)
         
-        return json.dumps({
+        return dumps_json({
             "suggested_enhancements": enhancements,
             "priority": "high" if assessment.get("quality_percentage", 100) < 70 else "medium"
-        }, indent=2)
+        })
     
     async def _generate_mbse_report(self, arguments: Dict[str, Any]) -> str:
         """Generate comprehensive MBSE report."""
@@ -1143,12 +1261,15 @@ Each operation executes fully server-side. Only filtered results sent to LLM."""
         """Run the MCP server."""
         from mcp.server.stdio import stdio_server
         
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await close_clients()
 
 
 def main() -> None:
@@ -1165,9 +1286,14 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     
-    # Create and run server
+    # Create and run server, on uvloop when it is installed
     server = ArcLangMCPServer(workspace_root)
-    asyncio.run(server.run())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run())
+    else:
+        uvloop.run(server.run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+Argument models for the generation, safety and integration tools.
+
+Each tool call's arguments are validated once on entry to execute(), so
+malformed input is rejected before any compiler or AI work starts.
+Defaults mirror the tool input schemas in server.py.
+"""
+
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+
+class GenerateRequirementArgs(BaseModel):
+    description: str
+    safety_level: Optional[str] = None
+    priority: str = "High"
+
+
+class GenerateComponentArgs(BaseModel):
+    description: str
+    component_type: str = "Logical"
+    safety_level: Optional[str] = None
+
+
+class SuggestArchitectureArgs(BaseModel):
+    requirements: List[str]
+    domain: str = "automotive"
+
+
+class GenerateDiagramArgs(BaseModel):
+    model_path: str
+    diagram_type: str
+    output_path: Optional[str] = None
+
+
+class GenerateAllDiagramsArgs(BaseModel):
+    model_path: str
+    output_dir: str = "./diagrams"
+
+
+class SafetyCheckArgs(BaseModel):
+    model_path: str
+    standard: str
+    generate_report: bool = False
+
+
+class HazardAnalysisArgs(BaseModel):
+    model_path: str
+    standard: str = "iso26262"
+
+
+class GitMergeArgs(BaseModel):
+    base_path: str
+    ours_path: str
+    theirs_path: str
+
+
+class PlmSyncArgs(BaseModel):
+    model_path: str
+    system: str
+    operation: str = "pull"
+
+
+TOOL_ARGUMENTS: Dict[str, Type[BaseModel]] = {
+    "arclang_generate_requirement": GenerateRequirementArgs,
+    "arclang_generate_component": GenerateComponentArgs,
+    "arclang_suggest_architecture": SuggestArchitectureArgs,
+    "arclang_generate_diagram": GenerateDiagramArgs,
+    "arclang_generate_all_diagrams": GenerateAllDiagramsArgs,
+    "arclang_safety_check": SafetyCheckArgs,
+    "arclang_hazard_analysis": HazardAnalysisArgs,
+    "arclang_git_merge": GitMergeArgs,
+    "arclang_plm_sync": PlmSyncArgs,
+}
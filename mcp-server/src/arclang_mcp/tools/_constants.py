@@ -0,0 +1,32 @@
+"""
+Fixed vocabularies shared by the tool modules, with their display forms.
+"""
+
+from typing import Dict
+
+# Capella diagram types supported by the compiler, in generation order
+DIAGRAM_TYPES = (
+    "operational", "functional", "component", "sequence",
+    "state-machine", "physical", "class", "tree",
+    "capability", "functional-chain"
+)
+
+# Display forms precomputed for the values the tool schemas allow
+_UPPER: Dict[str, str] = {
+    name: name.upper()
+    for name in ("iso26262", "do178c", "iec61508", "windchill", "teamcenter", "sap")
+}
+_CAPITALIZED: Dict[str, str] = {
+    name: name.capitalize()
+    for name in ("automotive", "aerospace", "defense", "industrial", "general", *DIAGRAM_TYPES)
+}
+
+
+def upper(name: str) -> str:
+    """name.upper(), looked up for known standards and PLM systems."""
+    return _UPPER.get(name) or name.upper()
+
+
+def capitalized(name: str) -> str:
+    """name.capitalize(), looked up for known domains and diagram types."""
+    return _CAPITALIZED.get(name) or name.capitalize()
@@ -2,66 +2,222 @@
 Core tools for ArcLang compilation, validation, and analysis.
 """
 
+import asyncio
 import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ..compiler.wrapper import ArcLangCompiler
 
+logger = logging.getLogger(__name__)
+
+# Parsed compiler results kept per (call, path, mtime, arguments)
+RESULT_CACHE_SIZE = 64
+
+# Responses to identical back-to-back calls (agent retries) on an unchanged
+# model are reused for RECENT_CALL_TTL seconds, keeping at most
+# RECENT_CALL_SIZE of them.
+RECENT_CALL_TTL = 2.0
+RECENT_CALL_SIZE = 8
+
+# Error prefixes of failures in the compiler's parse or semantic passes,
+# which `arclang check` would report too (as opposed to e.g. an IO error
+# writing the build output)
+_DIAGNOSTIC_ERROR_PREFIXES = ("Lexer error:", "Parser error:", "Parse error:", "Semantic error:")
+
+# Response templates. Metric blocks are filled with format_map over a
+# _DefaultingDict so counts the compiler did not report render as 0.
+_COMPILE_OK_HEADER = "✅ Compilation successful\n\n**Model**: {model}\n"
+_COMPILE_METRICS_TMPL = (
+    "**Requirements**: {requirements}\n"
+    "**Components**: {components}\n"
+    "**Functions**: {functions}\n"
+    "**Traces**: {traces}\n"
+)
+_VALIDATE_OK_TMPL = (
+    "✅ Validation passed\n\n"
+    "**Model**: {model}\n"
+    "**Syntax**: Valid\n"
+    "**Semantics**: Valid\n"
+)
+_VALIDATE_FAILED_TMPL = "❌ Validation failed\n\n**Model**: {model}\n\n**Errors** ({count}):\n"
+_TRACE_HEADER_TMPL = (
+    "🔗 **Traceability Analysis**\n\n"
+    "**Model**: {model}\n"
+    "**Coverage**: {coverage}%\n"
+    "**Total Traces**: {total_traces}\n\n"
+)
+_EXPORT_OK_TMPL = (
+    "✅ Diagram generated successfully\n\n"
+    "**Model**: {model}\n"
+    "**Format**: {format}\n"
+    "**Output**: {output_path}\n"
+)
+_EXPORT_METRICS_TMPL = "\n**Components**: {components}\n**Connections**: {connections}\n"
+_INFO_HEADER_TMPL = "📊 **Model Information**\n\n**Path**: {path}\n**Size**: {size_kb} KB\n\n"
+_INFO_METRICS_TMPL = (
+    "**Metrics**:\n"
+    "  - Requirements: {requirements}\n"
+    "  - Components: {components}\n"
+    "  - Functions: {functions}\n"
+    "  - Traces: {traces}\n"
+    "  - Actors: {actors}\n"
+    "  - Nodes: {nodes}\n\n"
+)
+_INFO_SAFETY_TMPL = (
+    "**Safety Metrics**:\n"
+    "  - ASIL-D: {asil_d}\n"
+    "  - ASIL-C: {asil_c}\n"
+    "  - ASIL-B: {asil_b}\n"
+    "  - ASIL-A: {asil_a}\n\n"
+)
+
+
+class _DefaultingDict(dict):
+    """dict whose missing keys read as 0, for format_map over metrics."""
+
+    def __missing__(self, key: str) -> int:
+        return 0
+
+
+def _bullet_list(items: List[Any]) -> str:
+    """Render items as '  - item' Markdown lines with a single join."""
+    if not items:
+        return ""
+    return "  - " + "\n  - ".join(map(str, items)) + "\n"
+
+
+@lru_cache(maxsize=512)
+def _resolve_cached(root: str, path_str: str) -> Path:
+    """Resolve path_str against root; memoized since sessions reuse model paths."""
+    path = Path(path_str).expanduser()  # Handle ~/path
+
+    if path.is_absolute():
+        # Absolute paths work anywhere (including /home/claude/)
+        return path
+    else:
+        # Relative paths resolved to workspace root
+        return Path(root) / path
+
+
+def _has_diagnostic_error(errors: List[str]) -> bool:
+    """Whether any parsed build error comes from the parse or semantic passes."""
+    return any(prefix in error for error in errors for prefix in _DIAGNOSTIC_ERROR_PREFIXES)
+
 
 class CoreTools:
     """Core ArcLang tools (compile, validate, trace, export)."""
 
+    TOOL_NAMES = frozenset({
+        "arclang_compile",
+        "arclang_validate",
+        "arclang_trace_analysis",
+        "arclang_export_diagram",
+        "arclang_info",
+    })
+
     def __init__(self, compiler: ArcLangCompiler, workspace_root: Path):
         self.compiler = compiler
-        self.workspace_root = workspace_root
+        # Absolute so _resolve_cached keys stay stable if the cwd changes
+        self.workspace_root = workspace_root.absolute()
+        self._handlers = {
+            "arclang_compile": self._compile,
+            "arclang_validate": self._validate,
+            "arclang_trace_analysis": self._trace_analysis,
+            "arclang_export_diagram": self._export_diagram,
+            "arclang_info": self._info,
+        }
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._recent: "OrderedDict[Tuple[str, str, int, int], Tuple[float, str]]" = OrderedDict()
 
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> str:
-        """Execute a core tool."""
-        if tool_name == "arclang_compile":
-            return await self._compile(arguments)
-        elif tool_name == "arclang_validate":
-            return await self._validate(arguments)
-        elif tool_name == "arclang_trace_analysis":
-            return await self._trace_analysis(arguments)
-        elif tool_name == "arclang_export_diagram":
-            return await self._export_diagram(arguments)
-        elif tool_name == "arclang_info":
-            return await self._info(arguments)
-        else:
+        """Execute a core tool.
+
+        An identical call made within RECENT_CALL_TTL seconds on an
+        unchanged model (same mtime and size) returns the previous response.
+        Exports write to a caller-chosen path, so they always run and clear
+        the recent responses.
+        """
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown core tool: {tool_name}")
 
+        if tool_name == "arclang_export_diagram":
+            self._recent.clear()
+            return await self._run_handler(handler, arguments)
+
+        # A model edited between retries (e.g. fixing a parse error) must not
+        # get the previous response, so the key includes its mtime and size
+        try:
+            st = self._resolve_path(str(arguments["model_path"])).stat()
+        except (KeyError, OSError):
+            return await self._run_handler(handler, arguments)
+
+        key = (
+            tool_name,
+            json.dumps(arguments, sort_keys=True, default=str),
+            st.st_mtime_ns,
+            st.st_size
+        )
+        now = time.monotonic()
+        recent = self._recent.get(key)
+        if recent is not None and now - recent[0] < RECENT_CALL_TTL:
+            return recent[1]
+
+        output = await self._run_handler(handler, arguments)
+        self._recent[key] = (now, output)
+        self._recent.move_to_end(key)
+        if len(self._recent) > RECENT_CALL_SIZE:
+            self._recent.popitem(last=False)
+        return output
+
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute independent core tool calls concurrently, returning results in order."""
+        return list(await asyncio.gather(*(self.execute(name, args) for name, args in calls)))
+
+    async def _run_handler(
+        self,
+        handler: Callable[[Dict[str, Any]], Awaitable[str]],
+        arguments: Dict[str, Any]
+    ) -> str:
+        """Run a tool handler, reporting a missing model as a ❌ response."""
+        try:
+            return await handler(arguments)
+        except FileNotFoundError as e:
+            return f"❌ Model not found: {e.filename}"
+
     async def _compile(self, args: Dict[str, Any]) -> str:
         """Compile ArcLang model."""
         model_path = self._resolve_path(args["model_path"])
         validate = args.get("validate", True)
         optimize = args.get("optimize", False)
 
-        result = await self.compiler.compile(
+        result = await self._cached_result(
+            self.compiler.compile,
             model_path,
             validate=validate,
             optimize=optimize
         )
 
         if result["success"]:
-            output = f"✅ Compilation successful\n\n"
-            output += f"**Model**: {model_path.name}\n"
+            parts = [_COMPILE_OK_HEADER.format(model=model_path.name)]
             
             if "metrics" in result:
-                metrics = result["metrics"]
-                output += f"**Requirements**: {metrics.get('requirements', 0)}\n"
-                output += f"**Components**: {metrics.get('components', 0)}\n"
-                output += f"**Functions**: {metrics.get('functions', 0)}\n"
-                output += f"**Traces**: {metrics.get('traces', 0)}\n"
+                parts.append(_COMPILE_METRICS_TMPL.format_map(_DefaultingDict(result["metrics"])))
             
             if validate and "validation" in result:
                 validation = result["validation"]
-                output += f"\n**Validation**: {validation.get('status', 'OK')}\n"
+                parts.append(f"\n**Validation**: {validation.get('status', 'OK')}\n")
                 if validation.get('warnings'):
-                    output += f"⚠️  Warnings: {len(validation['warnings'])}\n"
+                    parts.append(f"⚠️  Warnings: {len(validation['warnings'])}\n")
             
-            output += f"\n**Output**: {result.get('output_path', 'N/A')}"
-            return output
+            parts.append(f"\n**Output**: {result.get('output_path', 'N/A')}")
+            return "".join(parts)
         else:
             return f"❌ Compilation failed\n\n**Errors**:\n{result.get('errors', 'Unknown error')}"
 
@@ -70,27 +226,49 @@ class CoreTools:
         model_path = self._resolve_path(args["model_path"])
         strict = args.get("strict", False)
 
-        result = await self.compiler.validate(model_path, strict=strict)
+        try:
+            st = model_path.stat()
+        except FileNotFoundError:
+            raise  # reported as a ❌ response by _run_handler()
+        except OSError:
+            st = None
+
+        # `arclang build` runs the same checks as `arclang check`, so a build
+        # that already failed on this exact file answers the validation too,
+        # provided it failed in those checks and not afterwards.
+        build = self._cached_build(model_path, st) if st is not None else None
+        if build is not None and not build["success"] and _has_diagnostic_error(build["errors"]):
+            logger.debug("Reusing failed build of %s instead of re-validating", model_path)
+            result = {
+                "valid": False,
+                "warnings": [],
+                "errors": build["errors"],
+                "raw_output": build["raw_output"]
+            }
+        else:
+            result = await self._cached_result(
+                self.compiler.validate,
+                model_path,
+                stat=st,
+                strict=strict
+            )
 
         if result["valid"]:
-            output = f"✅ Validation passed\n\n"
-            output += f"**Model**: {model_path.name}\n"
-            output += f"**Syntax**: Valid\n"
-            output += f"**Semantics**: Valid\n"
+            output = _VALIDATE_OK_TMPL.format(model=model_path.name)
             
-            if result.get("warnings"):
-                output += f"\n⚠️  **Warnings** ({len(result['warnings'])}):\n"
-                for warning in result["warnings"][:5]:  # Show first 5
-                    output += f"  - {warning}\n"
+            warnings = result.get("warnings")
+            if warnings:
+                # Show first 5
+                output += f"\n⚠️  **Warnings** ({len(warnings)}):\n" + _bullet_list(warnings[:5])
             
             return output
         else:
-            output = f"❌ Validation failed\n\n"
-            output += f"**Model**: {model_path.name}\n\n"
-            output += f"**Errors** ({len(result.get('errors', []))}):\n"
-            for error in result.get("errors", [])[:10]:  # Show first 10
-                output += f"  - {error}\n"
-            return output
+            errors = result.get("errors", [])
+            # Show first 10
+            return (
+                _VALIDATE_FAILED_TMPL.format(model=model_path.name, count=len(errors))
+                + _bullet_list(errors[:10])
+            )
 
     async def _trace_analysis(self, args: Dict[str, Any]) -> str:
         """Analyze traceability."""
@@ -98,33 +276,35 @@ class CoreTools:
         show_gaps = args.get("show_gaps", True)
         matrix = args.get("matrix", False)
 
-        result = await self.compiler.trace_analysis(
+        result = await self._cached_result(
+            self.compiler.trace_analysis,
             model_path,
             show_gaps=show_gaps,
             matrix=matrix
         )
 
-        output = f"🔗 **Traceability Analysis**\n\n"
-        output += f"**Model**: {model_path.name}\n"
-        output += f"**Coverage**: {result.get('coverage', 0)}%\n"
-        output += f"**Total Traces**: {result.get('total_traces', 0)}\n\n"
+        coverage = result.get("coverage", 0)
+        parts = [_TRACE_HEADER_TMPL.format(
+            model=model_path.name,
+            coverage=coverage,
+            total_traces=result.get("total_traces", 0)
+        )]
 
         if show_gaps:
             issues = result.get("issues") or []
             if issues:
-                output += f"⚠️  **Traceability Issues** ({len(issues)}):\n\n"
-                for issue in issues[:10]:
-                    output += f"  - {issue}\n"
-                output += "\n"
-
-        if result.get("coverage", 0) >= 90:
-            output += "✅ Good traceability coverage"
-        elif result.get("coverage", 0) >= 70:
-            output += "⚠️  Moderate traceability coverage - consider adding more traces"
+                parts.append(f"⚠️  **Traceability Issues** ({len(issues)}):\n\n")
+                parts.append(_bullet_list(issues[:10]))
+                parts.append("\n")
+
+        if coverage >= 90:
+            parts.append("✅ Good traceability coverage")
+        elif coverage >= 70:
+            parts.append("⚠️  Moderate traceability coverage - consider adding more traces")
         else:
-            output += "❌ Low traceability coverage - significant gaps detected"
+            parts.append("❌ Low traceability coverage - significant gaps detected")
 
-        return output
+        return "".join(parts)
 
     async def _export_diagram(self, args: Dict[str, Any]) -> str:
         """Export architecture diagram."""
@@ -139,17 +319,16 @@ class CoreTools:
         )
 
         if result["success"]:
-            output = f"✅ Diagram generated successfully\n\n"
-            output += f"**Model**: {model_path.name}\n"
-            output += f"**Format**: {format_type}\n"
-            output += f"**Output**: {result['output_path']}\n"
+            parts = [_EXPORT_OK_TMPL.format(
+                model=model_path.name,
+                format=format_type,
+                output_path=result["output_path"]
+            )]
             
             if result.get("metrics"):
-                metrics = result["metrics"]
-                output += f"\n**Components**: {metrics.get('components', 0)}\n"
-                output += f"**Connections**: {metrics.get('connections', 0)}\n"
+                parts.append(_EXPORT_METRICS_TMPL.format_map(_DefaultingDict(result["metrics"])))
             
-            return output
+            return "".join(parts)
         else:
             return f"❌ Diagram generation failed\n\n{result.get('error', 'Unknown error')}"
 
@@ -158,34 +337,67 @@ class CoreTools:
         model_path = self._resolve_path(args["model_path"])
         detailed = args.get("detailed", False)
 
-        result = await self.compiler.info(model_path, detailed=detailed)
-
-        output = f"📊 **Model Information**\n\n"
-        output += f"**Path**: {model_path}\n"
-        output += f"**Size**: {result.get('size_kb', 0)} KB\n\n"
+        result = await self._cached_result(self.compiler.info, model_path, detailed=detailed)
 
         metrics = result.get("metrics", {})
-        output += f"**Metrics**:\n"
-        output += f"  - Requirements: {metrics.get('requirements', 0)}\n"
-        output += f"  - Components: {metrics.get('components', 0)}\n"
-        output += f"  - Functions: {metrics.get('functions', 0)}\n"
-        output += f"  - Traces: {metrics.get('traces', 0)}\n"
-        output += f"  - Actors: {metrics.get('actors', 0)}\n"
-        output += f"  - Nodes: {metrics.get('nodes', 0)}\n\n"
-
-        if metrics.get("safety"):
-            safety = metrics["safety"]
-            output += f"**Safety Metrics**:\n"
-            output += f"  - ASIL-D: {safety.get('asil_d', 0)}\n"
-            output += f"  - ASIL-C: {safety.get('asil_c', 0)}\n"
-            output += f"  - ASIL-B: {safety.get('asil_b', 0)}\n"
-            output += f"  - ASIL-A: {safety.get('asil_a', 0)}\n\n"
-
-        if result.get("coverage"):
-            coverage = result["coverage"]
-            output += f"**Traceability Coverage**: {coverage.get('percentage', 0)}%\n"
+        parts = [
+            _INFO_HEADER_TMPL.format(path=model_path, size_kb=result.get("size_kb", 0)),
+            _INFO_METRICS_TMPL.format_map(_DefaultingDict(metrics)),
+        ]
 
-        return output
+        safety = metrics.get("safety")
+        if safety:
+            parts.append(_INFO_SAFETY_TMPL.format_map(_DefaultingDict(safety)))
+
+        coverage = result.get("coverage")
+        if coverage:
+            parts.append(f"**Traceability Coverage**: {coverage.get('percentage', 0)}%\n")
+
+        return "".join(parts)
+
+    async def _cached_result(
+        self,
+        call: Callable[..., Awaitable[Dict[str, Any]]],
+        model_path: Path,
+        stat: Optional[os.stat_result] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Return call(model_path, **kwargs), reused while the model is unchanged.
+
+        Keyed by the compiler method, path, mtime and arguments, so a
+        compile -> validate -> trace -> info session on one file parses each
+        result once. Results without output (timeouts, missing binary) are
+        not cached. The model is stat()ed once here and the result handed
+        to the compiler (callers that already hold it pass `stat`); a missing
+        model raises FileNotFoundError.
+        """
+        try:
+            st = stat or model_path.stat()
+        except FileNotFoundError:
+            raise  # reported as a ❌ response by _run_handler()
+        except OSError:
+            return await call(model_path, **kwargs)
+
+        key = (call.__name__, str(model_path), st.st_mtime_ns, tuple(sorted(kwargs.items())))
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return cached
+
+        result = await call(model_path, stat=st, **kwargs)
+        if result.get("raw_output"):
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _cached_build(self, model_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Most recent cached compile result for model_path at its current mtime."""
+        path = str(model_path)
+        for key, result in reversed(self._result_cache.items()):
+            if key[0] == "compile" and key[1] == path and key[2] == st.st_mtime_ns:
+                return result
+        return None
 
     def _resolve_path(self, path_str: str) -> Path:
         """Resolve path relative to workspace root or allow absolute paths.
@@ -195,11 +407,4 @@ class CoreTools:
         - Relative paths: examples/test.arc (resolved to workspace_root)
         - ~ expansion: ~/test.arc (expands to user home)
         """
-        path = Path(path_str).expanduser()  # Handle ~/path
-        
-        if path.is_absolute():
-            # Absolute paths work anywhere (including /home/claude/)
-            return path
-        else:
-            # Relative paths resolved to workspace root
-            return self.workspace_root / path
+        return _resolve_cached(str(self.workspace_root), path_str)
@@ -2,39 +2,118 @@
 AI-powered generation tools for ArcLang.
 """
 
-from typing import Any, Dict
+import asyncio
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..ai.generator import AIGenerator
+from ..utils.cache import TTLCache
+from ._arguments import (
+    TOOL_ARGUMENTS,
+    GenerateAllDiagramsArgs,
+    GenerateComponentArgs,
+    GenerateDiagramArgs,
+    GenerateRequirementArgs,
+    SuggestArchitectureArgs,
+)
+from ._constants import DIAGRAM_TYPES, capitalized
+
+# arclang_suggest_architecture calls arriving within this window (seconds)
+# share one AI request, up to ARCHITECTURE_BATCH_SIZE calls per request.
+# A batch request is capped at 8192 output tokens, so 4 calls keeps each at
+# the 2048 tokens a single suggestion gets; a truncated batch reply would be
+# retried call by call.
+ARCHITECTURE_BATCH_WINDOW = 0.03
+ARCHITECTURE_BATCH_SIZE = 4
+
+# Generation responses reused for identical arguments within the cache TTL
+RESULT_CACHE_SIZE = 512
+
+# Fixed "Next Steps" footers appended to each response
+_REQUIREMENT_NEXT_STEPS = (
+    "**Next Steps**:\n"
+    "1. Review the generated requirement\n"
+    "2. Adjust safety level if needed\n"
+    "3. Add to your model file\n"
+    "4. Create traceability links to components"
+)
+_COMPONENT_NEXT_STEPS = (
+    "**Next Steps**:\n"
+    "1. Review the component structure\n"
+    "2. Add input/output ports if needed\n"
+    "3. Add to your logical_architecture block\n"
+    "4. Create traces to requirements"
+)
+_ARCHITECTURE_NEXT_STEPS = (
+    "\n**Next Steps**:\n"
+    "1. Review suggested architecture\n"
+    "2. Refine based on your specific needs\n"
+    "3. Generate individual components\n"
+    "4. Establish data flows and interfaces"
+)
+_DIAGRAM_NEXT_STEPS = (
+    "**Next Steps**:\n"
+    "1. Open the SVG file in a browser\n"
+    "2. Review the visual layout\n"
+    "3. Generate other diagram types if needed\n"
+    "4. Use arclang_generate_all_diagrams for complete set"
+)
+_ALL_DIAGRAMS_NEXT_STEPS = (
+    "**Next Steps**:\n"
+    "1. Open generated diagrams in browser\n"
+    "2. Review each diagram type\n"
+    "3. Use in documentation or presentations\n"
+    "4. Export to PNG if needed"
+)
 
 
 class GenerationTools:
     """AI generation tools for requirements, components, and architectures."""
 
+    TOOL_NAMES = frozenset({
+        "arclang_generate_requirement",
+        "arclang_generate_component",
+        "arclang_suggest_architecture",
+        "arclang_generate_diagram",
+        "arclang_generate_all_diagrams",
+    })
+
     def __init__(self, compiler: Any, config: Dict[str, Any]):
         self.compiler = compiler
         self.config = config
+        self._handlers = {
+            "arclang_generate_requirement": self._generate_requirement,
+            "arclang_generate_component": self._generate_component,
+            "arclang_suggest_architecture": self._suggest_architecture,
+            "arclang_generate_diagram": self._generate_diagram,
+            "arclang_generate_all_diagrams": self._generate_all_diagrams,
+        }
         self.generator = AIGenerator(config.get("ai", {}))
+        self._architecture_queue: asyncio.Queue = asyncio.Queue()
+        self._architecture_worker: Optional[asyncio.Task] = None
+        self._result_cache = TTLCache.from_config(config, RESULT_CACHE_SIZE)
 
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a generation tool."""
-        if tool_name == "arclang_generate_requirement":
-            return await self._generate_requirement(arguments)
-        elif tool_name == "arclang_generate_component":
-            return await self._generate_component(arguments)
-        elif tool_name == "arclang_suggest_architecture":
-            return await self._suggest_architecture(arguments)
-        elif tool_name == "arclang_generate_diagram":
-            return await self._generate_diagram(arguments)
-        elif tool_name == "arclang_generate_all_diagrams":
-            return await self._generate_all_diagrams(arguments)
-        else:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown generation tool: {tool_name}")
+        return await handler(TOOL_ARGUMENTS[tool_name].model_validate(arguments))
+
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute independent generation tool calls concurrently, returning results in order."""
+        return list(await asyncio.gather(*(self.execute(name, args) for name, args in calls)))
 
-    async def _generate_requirement(self, args: Dict[str, Any]) -> str:
+    async def _generate_requirement(self, args: GenerateRequirementArgs) -> str:
         """Generate requirement from natural language."""
-        description = args["description"]
-        safety_level = args.get("safety_level")
-        priority = args.get("priority", "High")
+        description = args.description
+        safety_level = args.safety_level
+        priority = args.priority
+
+        cache_key = ("requirement", description, safety_level, priority)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         requirement_code = await self.generator.generate_requirement(
             description=description,
@@ -42,20 +121,23 @@ class GenerationTools:
             priority=priority
         )
 
-        output = f"✨ **Generated Requirement**\n\n```arc\n{requirement_code}\n```\n\n"
-        output += "**Next Steps**:\n"
-        output += "1. Review the generated requirement\n"
-        output += "2. Adjust safety level if needed\n"
-        output += "3. Add to your model file\n"
-        output += "4. Create traceability links to components"
-
+        output = "".join((
+            f"✨ **Generated Requirement**\n\n```arc\n{requirement_code}\n```\n\n",
+            _REQUIREMENT_NEXT_STEPS
+        ))
+        self._result_cache.put(cache_key, output)
         return output
 
-    async def _generate_component(self, args: Dict[str, Any]) -> str:
+    async def _generate_component(self, args: GenerateComponentArgs) -> str:
         """Generate component from description."""
-        description = args["description"]
-        component_type = args.get("component_type", "Logical")
-        safety_level = args.get("safety_level")
+        description = args.description
+        component_type = args.component_type
+        safety_level = args.safety_level
+
+        cache_key = ("component", description, component_type, safety_level)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         component_code = await self.generator.generate_component(
             description=description,
@@ -63,65 +145,103 @@ class GenerationTools:
             safety_level=safety_level
         )
 
-        output = f"✨ **Generated Component**\n\n```arc\n{component_code}\n```\n\n"
-        output += "**Next Steps**:\n"
-        output += "1. Review the component structure\n"
-        output += "2. Add input/output ports if needed\n"
-        output += "3. Add to your logical_architecture block\n"
-        output += "4. Create traces to requirements"
-
+        output = "".join((
+            f"✨ **Generated Component**\n\n```arc\n{component_code}\n```\n\n",
+            _COMPONENT_NEXT_STEPS
+        ))
+        self._result_cache.put(cache_key, output)
         return output
 
-    async def _suggest_architecture(self, args: Dict[str, Any]) -> str:
+    async def _suggest_architecture(self, args: SuggestArchitectureArgs) -> str:
         """Suggest architecture based on requirements."""
-        requirements = args["requirements"]
-        domain = args.get("domain", "automotive")
-
-        suggestions = await self.generator.suggest_architecture(
-            requirements=requirements,
-            domain=domain
-        )
-
-        output = f"💡 **Architecture Suggestions**\n\n"
-        output += f"**Domain**: {domain.capitalize()}\n"
-        output += f"**Based on**: {len(requirements)} requirements\n\n"
-
-        output += "**Suggested Components**:\n\n"
+        requirements = args.requirements
+        domain = args.domain
+
+        # Requirement order does not change the suggestion, so it is not part of the key
+        cache_key = hashlib.blake2b(
+            b"\0".join([domain.encode(), *sorted(r.encode() for r in requirements)]),
+            digest_size=16
+        ).digest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        suggestions = await self._coalesced_suggest_architecture(requirements, domain)
+
+        parts = [
+            "💡 **Architecture Suggestions**\n\n",
+            f"**Domain**: {capitalized(domain)}\n",
+            f"**Based on**: {len(requirements)} requirements\n\n",
+            "**Suggested Components**:\n\n",
+        ]
         for i, component in enumerate(suggestions.get("components", []), 1):
-            output += f"{i}. **{component['name']}** ({component['type']})\n"
-            output += f"   - Purpose: {component['description']}\n"
+            parts.append(
+                f"{i}. **{component['name']}** ({component['type']})\n"
+                f"   - Purpose: {component['description']}\n"
+            )
             if component.get("safety_level"):
-                output += f"   - Safety: {component['safety_level']}\n"
-            output += "\n"
+                parts.append(f"   - Safety: {component['safety_level']}\n")
+            parts.append("\n")
 
         if suggestions.get("patterns"):
-            output += "\n**Recommended Patterns**:\n"
-            for pattern in suggestions["patterns"]:
-                output += f"  - {pattern}\n"
+            parts.append("\n**Recommended Patterns**:\n")
+            parts.extend(f"  - {pattern}\n" for pattern in suggestions["patterns"])
+
+        parts.append(_ARCHITECTURE_NEXT_STEPS)
+        output = "".join(parts)
+        # An unparseable AI response yields no components; retry it next time
+        if suggestions.get("components"):
+            self._result_cache.put(cache_key, output)
+        return output
 
-        output += "\n**Next Steps**:\n"
-        output += "1. Review suggested architecture\n"
-        output += "2. Refine based on your specific needs\n"
-        output += "3. Generate individual components\n"
-        output += "4. Establish data flows and interfaces"
+    async def _coalesced_suggest_architecture(
+        self,
+        requirements: List[str],
+        domain: str
+    ) -> Dict[str, Any]:
+        """Queue a suggestion request and wait for its batched result."""
+        future = asyncio.get_running_loop().create_future()
+        self._architecture_queue.put_nowait((requirements, domain, future))
+        if self._architecture_worker is None or self._architecture_worker.done():
+            self._architecture_worker = asyncio.create_task(self._drain_architecture_queue())
+        return await future
+
+    async def _drain_architecture_queue(self) -> None:
+        """Send queued suggestion requests to the generator in batches.
+
+        Waits ARCHITECTURE_BATCH_WINDOW for concurrent requests to arrive,
+        then resolves each request's future from one batched call. Exits
+        once the queue is empty; the next request starts a new worker.
+        """
+        queue = self._architecture_queue
+        while not queue.empty():
+            await asyncio.sleep(ARCHITECTURE_BATCH_WINDOW)
+            batch = []
+            while len(batch) < ARCHITECTURE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
 
-        return output
+            try:
+                results = await self.generator.suggest_architecture_batch(
+                    [(requirements, domain) for requirements, domain, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
 
-    async def _generate_diagram(self, args: Dict[str, Any]) -> str:
+    async def _generate_diagram(self, args: GenerateDiagramArgs) -> str:
         """Generate a specific diagram type from model."""
-        model_path = args["model_path"]
-        diagram_type = args["diagram_type"]
-        output_path = args.get("output_path")
-
-        # Supported diagram types
-        diagram_types = [
-            "operational", "functional", "component", "sequence",
-            "state-machine", "physical", "class", "tree",
-            "capability", "functional-chain"
-        ]
+        model_path = args.model_path
+        diagram_type = args.diagram_type
+        output_path = args.output_path
 
-        if diagram_type not in diagram_types:
-            return f"❌ **Error**: Unknown diagram type '{diagram_type}'\n\nSupported types: {', '.join(diagram_types)}"
+        if diagram_type not in DIAGRAM_TYPES:
+            return f"❌ **Error**: Unknown diagram type '{diagram_type}'\n\nSupported types: {', '.join(DIAGRAM_TYPES)}"
 
         # Generate diagram using compiler
         result = await self.compiler.generate_diagram(
@@ -130,76 +250,69 @@ class GenerationTools:
             output_path=output_path
         )
 
-        output = f"📊 **Generated {diagram_type.capitalize()} Diagram**\n\n"
-        output += f"**Input**: {model_path}\n"
-        output += f"**Output**: {result['output_path']}\n"
-        output += f"**Size**: {result['size']}\n"
-        output += f"**Elements**: {result.get('element_count', 'N/A')}\n\n"
-
-        output += "**Next Steps**:\n"
-        output += "1. Open the SVG file in a browser\n"
-        output += "2. Review the visual layout\n"
-        output += "3. Generate other diagram types if needed\n"
-        output += "4. Use arclang_generate_all_diagrams for complete set"
-
-        return output
+        return "".join((
+            f"📊 **Generated {capitalized(diagram_type)} Diagram**\n\n",
+            f"**Input**: {model_path}\n",
+            f"**Output**: {result['output_path']}\n",
+            f"**Size**: {result['size']}\n",
+            f"**Elements**: {result.get('element_count', 'N/A')}\n\n",
+            _DIAGRAM_NEXT_STEPS
+        ))
 
-    async def _generate_all_diagrams(self, args: Dict[str, Any]) -> str:
+    async def _generate_all_diagrams(self, args: GenerateAllDiagramsArgs) -> str:
         """Generate all 10 Capella diagram types from model."""
-        model_path = args["model_path"]
-        output_dir = args.get("output_dir", "./diagrams")
-
-        # All 10 diagram types
-        diagram_types = [
-            "operational", "functional", "component", "sequence",
-            "state-machine", "physical", "class", "tree",
-            "capability", "functional-chain"
-        ]
+        model_path = args.model_path
+        output_dir = args.output_dir
 
-        results = {}
-        for diagram_type in diagram_types:
-            try:
-                result = await self.compiler.generate_diagram(
+        # Each diagram is an independent compiler invocation, so run them concurrently
+        outcomes = await asyncio.gather(
+            *(
+                self.compiler.generate_diagram(
                     model_path=model_path,
                     diagram_type=diagram_type,
                     output_path=f"{output_dir}/{diagram_type}.svg"
                 )
+                for diagram_type in DIAGRAM_TYPES
+            ),
+            return_exceptions=True
+        )
+
+        results = {}
+        for diagram_type, result in zip(DIAGRAM_TYPES, outcomes):
+            if isinstance(result, Exception):
+                results[diagram_type] = {
+                    "status": "⏳ Skipped",
+                    "reason": str(result)
+                }
+            else:
                 results[diagram_type] = {
                     "status": "✅ Success",
                     "path": result['output_path'],
                     "size": result['size'],
                     "elements": result.get('element_count', 'N/A')
                 }
-            except Exception as e:
-                results[diagram_type] = {
-                    "status": "⏳ Skipped",
-                    "reason": str(e)
-                }
 
         # Generate summary
-        output = "📊 **All Diagrams Generated**\n\n"
-        output += f"**Input Model**: {model_path}\n"
-        output += f"**Output Directory**: {output_dir}\n\n"
-
-        output += "**Results**:\n\n"
+        parts = [
+            "📊 **All Diagrams Generated**\n\n",
+            f"**Input Model**: {model_path}\n",
+            f"**Output Directory**: {output_dir}\n\n",
+            "**Results**:\n\n",
+        ]
         success_count = 0
         for dtype, result in results.items():
-            output += f"**{dtype.capitalize()}**: {result['status']}\n"
+            parts.append(f"**{capitalized(dtype)}**: {result['status']}\n")
             if result['status'] == "✅ Success":
-                output += f"  - Path: {result['path']}\n"
-                output += f"  - Size: {result['size']}\n"
-                output += f"  - Elements: {result.get('elements', 'N/A')}\n"
+                parts.append(
+                    f"  - Path: {result['path']}\n"
+                    f"  - Size: {result['size']}\n"
+                    f"  - Elements: {result.get('elements', 'N/A')}\n"
+                )
                 success_count += 1
             elif 'reason' in result:
-                output += f"  - Reason: {result['reason']}\n"
-            output += "\n"
-
-        output += f"**Summary**: {success_count}/{len(diagram_types)} diagrams generated successfully\n\n"
+                parts.append(f"  - Reason: {result['reason']}\n")
+            parts.append("\n")
 
-        output += "**Next Steps**:\n"
-        output += "1. Open generated diagrams in browser\n"
-        output += "2. Review each diagram type\n"
-        output += "3. Use in documentation or presentations\n"
-        output += "4. Export to PNG if needed"
-
-        return output
+        parts.append(f"**Summary**: {success_count}/{len(DIAGRAM_TYPES)} diagrams generated successfully\n\n")
+        parts.append(_ALL_DIAGRAMS_NEXT_STEPS)
+        return "".join(parts)
@@ -2,31 +2,54 @@
 Integration tools for Git, PLM, and requirements management systems.
 """
 
+import asyncio
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+from ._arguments import TOOL_ARGUMENTS, GitMergeArgs, PlmSyncArgs
+from ._constants import upper
+
+
+@lru_cache(maxsize=1024)
+def _path(path_str: str) -> Path:
+    """Path for a tool argument; memoized since batched calls repeat paths."""
+    return Path(path_str)
 
 
 class IntegrationTools:
     """Integration tools for Git, PLM, DOORS, etc."""
 
+    TOOL_NAMES = frozenset({
+        "arclang_git_merge",
+        "arclang_plm_sync",
+    })
+
     def __init__(self, compiler: Any, config: Dict[str, Any]):
         self.compiler = compiler
         self.config = config
+        self._handlers = {
+            "arclang_git_merge": self._git_merge,
+            "arclang_plm_sync": self._plm_sync,
+        }
 
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute an integration tool."""
-        if tool_name == "arclang_git_merge":
-            return await self._git_merge(arguments)
-        elif tool_name == "arclang_plm_sync":
-            return await self._plm_sync(arguments)
-        else:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown integration tool: {tool_name}")
+        return await handler(TOOL_ARGUMENTS[tool_name].model_validate(arguments))
+
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute independent integration tool calls concurrently, returning results in order."""
+        return list(await asyncio.gather(*(self.execute(name, args) for name, args in calls)))
 
-    async def _git_merge(self, args: Dict[str, Any]) -> str:
+    async def _git_merge(self, args: GitMergeArgs) -> str:
         """Semantic merge assistance."""
-        base_path = Path(args["base_path"])
-        ours_path = Path(args["ours_path"])
-        theirs_path = Path(args["theirs_path"])
+        base_path = _path(args.base_path)
+        ours_path = _path(args.ours_path)
+        theirs_path = _path(args.theirs_path)
 
         try:
             result = await self.compiler.semantic_merge(
@@ -37,29 +60,31 @@ class IntegrationTools:
         except NotImplementedError as e:
             return f"❌ **Semantic merge not available**\n\n{e}"
 
-        output = f"🔀 **Semantic Merge Analysis**\n\n"
+        parts = ["🔀 **Semantic Merge Analysis**\n\n"]
         
         if result.get("clean_merge"):
-            output += "✅ **Clean merge** - No conflicts!\n\n"
-            output += f"**Elements merged**: {result.get('merged_count', 0)}\n"
+            parts.append("✅ **Clean merge** - No conflicts!\n\n")
+            parts.append(f"**Elements merged**: {result.get('merged_count', 0)}\n")
         else:
             conflicts = result.get("conflicts", [])
-            output += f"⚠️  **Conflicts detected**: {len(conflicts)}\n\n"
+            parts.append(f"⚠️  **Conflicts detected**: {len(conflicts)}\n\n")
             
-            for conflict in conflicts[:5]:
-                output += f"**{conflict['id']}**:\n"
-                output += f"  - Type: {conflict['type']}\n"
-                output += f"  - Ours: {conflict.get('ours_summary', 'N/A')}\n"
-                output += f"  - Theirs: {conflict.get('theirs_summary', 'N/A')}\n"
-                output += f"  - Suggestion: {conflict.get('suggestion', 'Manual resolution needed')}\n\n"
+            for conflict in islice(conflicts, 5):
+                parts.append(
+                    f"**{conflict['id']}**:\n"
+                    f"  - Type: {conflict['type']}\n"
+                    f"  - Ours: {conflict.get('ours_summary', 'N/A')}\n"
+                    f"  - Theirs: {conflict.get('theirs_summary', 'N/A')}\n"
+                    f"  - Suggestion: {conflict.get('suggestion', 'Manual resolution needed')}\n\n"
+                )
 
-        return output
+        return "".join(parts)
 
-    async def _plm_sync(self, args: Dict[str, Any]) -> str:
+    async def _plm_sync(self, args: PlmSyncArgs) -> str:
         """PLM synchronization."""
-        model_path = Path(args["model_path"])
-        system = args["system"]
-        operation = args.get("operation", "pull")
+        model_path = _path(args.model_path)
+        system = args.system
+        operation = args.operation
 
         result = await self.compiler.plm_sync(
             model_path=model_path,
@@ -67,18 +92,20 @@ class IntegrationTools:
             operation=operation
         )
 
-        output = f"🔄 **PLM Synchronization**\n\n"
-        output += f"**System**: {system.upper()}\n"
-        output += f"**Operation**: {operation}\n"
-        output += f"**Model**: {model_path.name}\n\n"
+        parts = [
+            "🔄 **PLM Synchronization**\n\n",
+            f"**System**: {upper(system)}\n",
+            f"**Operation**: {operation}\n",
+            f"**Model**: {model_path.name}\n\n",
+        ]
 
         if result.get("success"):
-            output += "✅ Synchronization successful\n\n"
+            parts.append("✅ Synchronization successful\n\n")
             if operation == "pull":
-                output += f"**Changes pulled**: {result.get('changes_count', 0)}\n"
+                parts.append(f"**Changes pulled**: {result.get('changes_count', 0)}\n")
             elif operation == "push":
-                output += f"**Changes pushed**: {result.get('changes_count', 0)}\n"
+                parts.append(f"**Changes pushed**: {result.get('changes_count', 0)}\n")
         else:
-            output += f"❌ Synchronization failed\n\n{result.get('error', 'Unknown error')}"
+            parts.append(f"❌ Synchronization failed\n\n{result.get('error', 'Unknown error')}")
 
-        return output
+        return "".join(parts)
@@ -2,31 +2,118 @@
 Safety validation tools for ISO 26262, DO-178C, IEC 61508.
 """
 
+import asyncio
+import hashlib
+import os
+import re
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.cache import TTLCache
+from ._arguments import TOOL_ARGUMENTS, HazardAnalysisArgs, SafetyCheckArgs
+from ._constants import upper
+
+# Safety check responses reused while the model, its imports, the standard
+# and the arclang binary are unchanged
+RESULT_CACHE_SIZE = 512
+
+# Issue icon by severity; anything other than "error" renders as a warning
+_SEVERITY_ICONS = {"error": "🔴"}
+_DEFAULT_SEVERITY_ICON = "⚠️"
+
+
+@lru_cache(maxsize=1024)
+def _path(path_str: str) -> Path:
+    """Path for a tool argument; memoized since batched calls repeat paths."""
+    return Path(path_str)
+
+
+# `import "relative/path.arc"` declarations; imports resolve against the importing file's directory
+_IMPORT_PATTERN = re.compile(rb'^\s*import\s+"([^"]*)"', re.MULTILINE)
+
+
+def _content_key(model_path: Path, standard: str, binary_path: Optional[str]) -> Optional[bytes]:
+    """blake2b key for a safety check, or None if the model is unreadable.
+
+    Covers the resolved model path (the response names the model), the
+    standard, the arclang binary's identity and mtime, and the bytes of
+    the model and every file it imports, transitively.
+    """
+    root = model_path.resolve()
+    digest = hashlib.blake2b(b"\0".join((str(root).encode(), standard.encode())), digest_size=16)
+    if binary_path:
+        try:
+            st = os.stat(binary_path)
+            digest.update(f"\0{binary_path}\0{st.st_mtime_ns}\0{st.st_size}".encode())
+        except OSError:
+            digest.update(f"\0{binary_path}".encode())
+
+    seen = {root}
+    pending = [root]
+    while pending:
+        source = pending.pop()
+        try:
+            data = source.read_bytes()
+        except OSError:
+            if source == root:
+                return None
+            data = b"<missing>"
+        digest.update(b"\0" + str(source).encode() + b"\0" + data)
+        for match in _IMPORT_PATTERN.finditer(data):
+            target = (source.parent / match.group(1).decode(errors="replace")).resolve()
+            if target not in seen:
+                seen.add(target)
+                pending.append(target)
+    return digest.digest()
 
 
 class SafetyTools:
     """Safety compliance and analysis tools."""
 
+    TOOL_NAMES = frozenset({
+        "arclang_safety_check",
+        "arclang_hazard_analysis",
+    })
+
     def __init__(self, compiler: Any, config: Dict[str, Any]):
         self.compiler = compiler
         self.config = config
+        self._handlers = {
+            "arclang_safety_check": self._safety_check,
+            "arclang_hazard_analysis": self._hazard_analysis,
+        }
+        self._result_cache = TTLCache.from_config(config, RESULT_CACHE_SIZE)
 
     async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Execute a safety tool."""
-        if tool_name == "arclang_safety_check":
-            return await self._safety_check(arguments)
-        elif tool_name == "arclang_hazard_analysis":
-            return await self._hazard_analysis(arguments)
-        else:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown safety tool: {tool_name}")
+        return await handler(TOOL_ARGUMENTS[tool_name].model_validate(arguments))
 
-    async def _safety_check(self, args: Dict[str, Any]) -> str:
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute independent safety tool calls concurrently, returning results in order."""
+        return list(await asyncio.gather(*(self.execute(name, args) for name, args in calls)))
+
+    async def _safety_check(self, args: SafetyCheckArgs) -> str:
         """Validate safety compliance."""
-        model_path = Path(args["model_path"])
-        standard = args["standard"]
-        generate_report = args.get("generate_report", False)
+        model_path = _path(args.model_path)
+        standard = args.standard
+        generate_report = args.generate_report
+
+        # Report runs write a file, so only plain checks are served from cache.
+        # The model is hashed off the event loop so large files don't stall other calls.
+        cache_key = None
+        if not generate_report:
+            cache_key = await asyncio.to_thread(
+                _content_key, model_path, standard, getattr(self.compiler, "binary_path", None)
+            )
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         result = await self.compiler.safety_check(
             model_path,
@@ -34,38 +121,38 @@ class SafetyTools:
             generate_report=generate_report
         )
 
-        output = f"🛡️  **Safety Compliance Check**\n\n"
-        output += f"**Standard**: {standard.upper()}\n"
-        output += f"**Model**: {model_path.name}\n\n"
-
-        if result.get("compliant"):
-            output += f"✅ **Status**: Compliant\n\n"
-        else:
-            output += f"❌ **Status**: Non-compliant\n\n"
+        parts = [
+            "🛡️  **Safety Compliance Check**\n\n",
+            f"**Standard**: {upper(standard)}\n",
+            f"**Model**: {model_path.name}\n\n",
+            "✅ **Status**: Compliant\n\n" if result.get("compliant")
+            else "❌ **Status**: Non-compliant\n\n",
+        ]
 
         issues = result.get("issues", [])
         if issues:
-            output += f"**Issues Found** ({len(issues)}):\n\n"
-            for issue in issues[:10]:
-                severity = issue.get("severity", "warning")
-                icon = "🔴" if severity == "error" else "⚠️"
-                output += f"{icon} **{issue['title']}**\n"
-                output += f"   {issue['description']}\n\n"
+            parts.append(f"**Issues Found** ({len(issues)}):\n\n")
+            for issue in islice(issues, 10):
+                icon = _SEVERITY_ICONS.get(issue.get("severity"), _DEFAULT_SEVERITY_ICON)
+                parts.append(f"{icon} **{issue['title']}**\n   {issue['description']}\n\n")
 
         if result.get("recommendations"):
-            output += "\n**Recommendations**:\n"
-            for rec in result["recommendations"][:5]:
-                output += f"  - {rec}\n"
+            parts.append("\n**Recommendations**:\n")
+            parts.extend(f"  - {rec}\n" for rec in islice(result["recommendations"], 5))
 
         if generate_report and result.get("report_path"):
-            output += f"\n📄 **Detailed Report**: {result['report_path']}"
+            parts.append(f"\n📄 **Detailed Report**: {result['report_path']}")
 
+        output = "".join(parts)
+        # Runs without output (timeout, missing binary) are not cached
+        if cache_key is not None and result.get("raw_output"):
+            self._result_cache.put(cache_key, output)
         return output
 
-    async def _hazard_analysis(self, args: Dict[str, Any]) -> str:
+    async def _hazard_analysis(self, args: HazardAnalysisArgs) -> str:
         """Perform hazard analysis."""
-        model_path = Path(args["model_path"])
-        standard = args.get("standard", "iso26262")
+        model_path = _path(args.model_path)
+        standard = args.standard
 
         try:
             result = await self.compiler.hazard_analysis(
@@ -75,18 +162,21 @@ class SafetyTools:
         except NotImplementedError as e:
             return f"❌ **Hazard Analysis (HARA) not available**\n\n{e}"
 
-        output = f"⚠️  **Hazard Analysis (HARA)**\n\n"
-        output += f"**Standard**: {standard.upper()}\n"
-        output += f"**Model**: {model_path.name}\n\n"
-
         hazards = result.get("hazards", [])
-        output += f"**Hazards Identified**: {len(hazards)}\n\n"
-
-        for hazard in hazards[:5]:
-            output += f"**{hazard['id']}**: {hazard['description']}\n"
-            output += f"  - Severity: {hazard['severity']}\n"
-            output += f"  - Exposure: {hazard.get('exposure', 'N/A')}\n"
-            output += f"  - Controllability: {hazard.get('controllability', 'N/A')}\n"
-            output += f"  - ASIL: {hazard.get('asil', 'N/A')}\n\n"
+        parts = [
+            "⚠️  **Hazard Analysis (HARA)**\n\n",
+            f"**Standard**: {upper(standard)}\n",
+            f"**Model**: {model_path.name}\n\n",
+            f"**Hazards Identified**: {len(hazards)}\n\n",
+        ]
+
+        for hazard in islice(hazards, 5):
+            parts.append(
+                f"**{hazard['id']}**: {hazard['description']}\n"
+                f"  - Severity: {hazard['severity']}\n"
+                f"  - Exposure: {hazard.get('exposure', 'N/A')}\n"
+                f"  - Controllability: {hazard.get('controllability', 'N/A')}\n"
+                f"  - ASIL: {hazard.get('asil', 'N/A')}\n\n"
+            )
 
-        return output
+        return "".join(parts)
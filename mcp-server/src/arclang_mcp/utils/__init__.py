@@ -2,6 +2,8 @@
 Utility functions and configuration management.
 """
 
+from .cache import TTLCache
 from .config import load_config
+from .serialization import dumps_json
 
-__all__ = ["load_config"]
+__all__ = ["load_config", "dumps_json", "TTLCache"]
@@ -0,0 +1,46 @@
+"""
+Response caching for deterministic tool calls.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """LRU cache whose entries expire ttl seconds after they are stored.
+
+    A ttl of 0 disables the cache: get() always misses and put() is a no-op.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], maxsize: int) -> "TTLCache":
+        """Build a cache from the [cache] config table (enabled, ttl)."""
+        cache_config = config.get("cache", {})
+        ttl = cache_config.get("ttl", 3600) if cache_config.get("enabled", True) else 0
+        return cls(maxsize, ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the live value stored under key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
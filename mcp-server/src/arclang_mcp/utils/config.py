@@ -2,14 +2,52 @@
 Configuration management for ArcLang MCP Server.
 """
 
+import copy
 import os
-import toml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Loaded configs keyed by workspace, config file mtime and the environment
+# overrides, so unchanged inputs skip the TOML parse and merge.
+CONFIG_CACHE_SIZE = 8
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, str, str], Dict[str, Any]]" = OrderedDict()
 
 
 def load_config(workspace_root: Path) -> Dict[str, Any]:
-    """Load configuration from .arclang-mcp.toml or environment."""
+    """Load configuration from .arclang-mcp.toml or environment.
+
+    Returns a fresh copy on every call, so callers may modify it freely.
+    """
+    config_file = workspace_root / ".arclang-mcp.toml"
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    key = (
+        str(config_file),
+        mtime_ns,
+        os.environ.get("ARCLANG_BINARY", ""),
+        os.environ.get("ANTHROPIC_API_KEY", "")
+    )
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = _CONFIG_CACHE[key] = _build_config(workspace_root, config_file)
+        if len(_CONFIG_CACHE) > CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+    else:
+        _CONFIG_CACHE.move_to_end(key)
+    return copy.deepcopy(cached)
+
+
+def _build_config(workspace_root: Path, config_file: Path) -> Dict[str, Any]:
+    """Merge defaults, the workspace config file and environment overrides."""
     
     # Default configuration
     config = {
@@ -41,10 +79,10 @@ def load_config(workspace_root: Path) -> Dict[str, Any]:
     }
     
     # Try to load from .arclang-mcp.toml
-    config_file = workspace_root / ".arclang-mcp.toml"
     if config_file.exists():
         try:
-            user_config = toml.load(config_file)
+            with config_file.open("rb") as f:
+                user_config = tomllib.load(f)
             config = _deep_merge(config, user_config)
         except Exception as e:
             print(f"Warning: Failed to load config file: {e}")
@@ -60,13 +98,20 @@ def load_config(workspace_root: Path) -> Dict[str, Any]:
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two dictionaries."""
-    result = base.copy()
+    """Deep merge two dictionaries.
+
+    base is copied once up front and nested tables are then merged in place
+    from an explicit stack, instead of copying every level recursively.
+    """
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
     
     return result
@@ -0,0 +1,22 @@
+"""
+JSON serialization for tool responses.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON text.
+
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise; both produce the same indented layout.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
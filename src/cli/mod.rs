@@ -926,6 +926,7 @@ impl CliRunner {
                 println!("✓ Export successful");
                 println!("  Input: {}", input.display());
                 println!("  Output: {}", output.display());
+                println!("  Size: {} bytes", output_content.len());
                 println!("  Format: {:?}", format);
                 
                 Ok(())
@@ -1207,6 +1208,7 @@ impl CliRunner {
                 println!("✓ Architecture Explorer generated successfully");
                 println!("  Input: {}", input.display());
                 println!("  Output: {}", output_html.display());
+                println!("  Size: {} bytes", html.len());
                 println!("  Data: {}", output_json.display());
                 println!("  Requirements: {}", result.semantic_model.requirements.len());
                 println!("  Components: {}", result.semantic_model.components.len());
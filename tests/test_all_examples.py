@@ -4,20 +4,71 @@ Comprehensive Selenium-based test suite for ArcLang
 Tests all examples with all visualization formats
 """
 
+import argparse
+import hashlib
+import mmap
 import os
+import re
+import selectors
 import sys
 import subprocess
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import json
 
+try:
+    from blake3 import blake3
+except ImportError:  # optional: SIMD hashing for the result cache keys
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON report serialization
+    orjson = None
+
+# Before an explorer page is opened, the outgoing page is marked stale so the
+# readiness check can tell when the new document has replaced it. The page
+# itself is opened with driver.get(): a script-initiated navigation to a
+# file:// URL is refused from the data:/about:blank start page. Once ready,
+# the check also returns the SVG's width and height and the errors the page
+# has recorded (see ERROR_COLLECTOR_JS), saving separate lookups.
+MARK_STALE_JS = "window.__arclangStale = true; window.stop();"
+EXPLORER_READY_JS = """
+if (window.__arclangStale) return null;
+const svg = document.querySelector('svg');
+return svg && [svg.getAttribute('width'), svg.getAttribute('height'), window.__arclangErrors || []];
+"""
+
+# Installed in every explorer tab before page scripts run: records what
+# Chrome would log as SEVERE (console.error, uncaught errors and rejections,
+# failed resource loads) on the page itself, since the shared browser log
+# can't tell tabs apart
+ERROR_COLLECTOR_JS = """
+(() => {
+    const errors = window.__arclangErrors = [];
+    const consoleError = console.error;
+    console.error = function (...args) {
+        errors.push(args.map(String).join(' '));
+        return consoleError.apply(this, args);
+    };
+    window.addEventListener('error', (e) => {
+        errors.push(e.message || `Failed to load resource: ${e.target.src || e.target.href}`);
+    }, true);
+    window.addEventListener('unhandledrejection', (e) => {
+        errors.push(`Uncaught (in promise) ${e.reason}`);
+    });
+})();
+"""
+
 @dataclass
 class TestResult:
     name: str
@@ -25,13 +76,129 @@ class TestResult:
     message: str
     duration: float
     file_size: int = 0
+    artifact: Optional[str] = None  # file produced by a passing test, if any
+
+
+def _file_digest(path: Path) -> str:
+    """Hex digest of a file's contents: BLAKE3 if installed, else SHA-256"""
+    with open(path, 'rb') as f:
+        if blake3 is None:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+        
+        digest = blake3()
+        if os.fstat(f.fileno()).st_size > 0:  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        return digest.hexdigest()
+
+# Exports land here with --tmpfs. The path is fixed, not a fresh temp dir,
+# so cached passes still find their artifacts on the next run (until reboot)
+TMPFS_ARTIFACT_DIR = Path('/dev/shm/arclang-test-results')
+
+# Bytes of subprocess output kept by _run_with_timeout: the tail of stdout
+# (where arclang prints its summary) and the head of stderr (the tests only
+# report its first 200 characters)
+OUTPUT_LIMIT = 4096
+
+
+def _run_with_timeout(cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run cmd capturing text output, raising subprocess.TimeoutExpired after timeout seconds.
+
+    On Linux, exit is detected through a pidfd in the same selector that
+    drains stdout/stderr, so the call returns as soon as the process is done
+    instead of in subprocess.run's sleep-polling wait. Only OUTPUT_LIMIT
+    bytes of each stream are kept, so a long backtrace is read and dropped
+    rather than buffered and decoded. Elsewhere this is subprocess.run.
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        stdout_fd, stderr_fd = proc.stdout.fileno(), proc.stderr.fileno()
+        output = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        pidfd = os.pidfd_open(proc.pid)
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(pidfd, selectors.EVENT_READ)
+                for fd in output:
+                    selector.register(fd, selectors.EVENT_READ)
+                
+                # Done once the process has exited and both pipes hit EOF
+                while selector.get_map():
+                    events = selector.select(deadline - time.monotonic())
+                    if not events:
+                        proc.kill()
+                        proc.wait()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    for key, _ in events:
+                        chunk = os.read(key.fd, 65536) if key.fd != pidfd else b''
+                        if not chunk:
+                            selector.unregister(key.fd)
+                        elif key.fd == stdout_fd:
+                            output[stdout_fd] += chunk
+                            del output[stdout_fd][:-OUTPUT_LIMIT]
+                        elif len(output[stderr_fd]) < OUTPUT_LIMIT:
+                            output[stderr_fd] += chunk[:OUTPUT_LIMIT - len(output[stderr_fd])]
+        finally:
+            os.close(pidfd)
+        
+        stdout, stderr = (output[fd].decode(errors='replace') for fd in (stdout_fd, stderr_fd))
+        return subprocess.CompletedProcess(cmd, proc.wait(), stdout, stderr)
+
+# "  Size: <n> bytes" line arclang export/explorer print after writing the output
+_SIZE_LINE = re.compile(r'^\s*Size: (\d+) bytes$', re.MULTILINE)
+
+
+def _artifact_size(stdout: str, path: Path) -> Optional[int]:
+    """Size arclang reported for the file it wrote, or None if it does not exist.
+
+    Older arclang builds don't print the size line; fall back to one stat().
+    """
+    match = _SIZE_LINE.search(stdout)
+    if match:
+        return int(match.group(1))
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
 
 class ArcLangTester:
-    def __init__(self, arclang_bin: str, examples_dir: str, output_dir: str):
+    def __init__(self, arclang_bin: str, examples_dir: str, output_dir: str, jobs: int = 1,
+                 explorer_jobs: int = 1, use_cache: bool = True, fail_fast: int = 5,
+                 artifact_dir: Optional[str] = None):
         self.arclang_bin = arclang_bin
+        self.jobs = max(1, jobs)
+        self.explorer_jobs = max(1, explorer_jobs)
         self.examples_dir = Path(examples_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Exported files go to artifact_dir (e.g. on tmpfs) when given;
+        # reports and the result cache always stay in output_dir
+        self.artifact_dir = Path(artifact_dir) if artifact_dir else self.output_dir
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Passing results are cached by binary + source digest, see run_cached
+        self.cache_dir: Optional[Path] = None
+        if use_cache:
+            self.cache_dir = self.output_dir / '.cache'
+            self.cache_dir.mkdir(exist_ok=True)
+            self._binary_digest = _file_digest(Path(arclang_bin))
+            self._source_digests: Dict[Path, str] = {}
+            
+            # Digests of explorer HTML that already rendered cleanly, with the
+            # SVG [width, height]; identical pages skip the browser, see test_explorer
+            self._rendered_explorers: Dict[str, List[str]] = {}
+            self._rendered_explorers_lock = threading.Lock()
+            try:
+                self._rendered_explorers = json.loads((self.cache_dir / 'explorer.json').read_text())
+            except (OSError, ValueError):
+                pass
         
         # Test configurations
         self.viz_formats = [
@@ -51,17 +218,35 @@ class ArcLangTester:
         
         self.results: List[TestResult] = []
         
+        # Consecutive failures per (category, format); once a streak reaches
+        # fail_fast the rest of that category is skipped (0 disables)
+        self.fail_fast = fail_fast
+        self._fail_streak: Dict[Tuple[str, ...], int] = {}
+        self._fail_streak_lock = threading.Lock()
+        
         # Setup Selenium
         self.setup_driver()
     
     def setup_driver(self):
-        """Setup headless Chrome driver"""
+        """Setup headless Chrome driver
+        
+        All explorer tests share one Chrome, each worker thread in its own
+        tab, so pages load and render side by side without a browser per
+        worker. WebDriver is not thread-safe, so commands are serialized by
+        a lock and sent to the caller's tab, see _in_tab.
+        """
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
+        # Tabs other than the focused one must keep rendering at full speed
+        chrome_options.add_argument('--disable-background-timer-throttling')
+        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        # Readiness is polled by script; don't block the shared session on loads
+        chrome_options.page_load_strategy = 'none'
         
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
@@ -70,11 +255,111 @@ class ArcLangTester:
             print(f"✗ Failed to initialize WebDriver: {e}")
             print("  Please install chromedriver: brew install chromedriver")
             sys.exit(1)
+        
+        self._driver_lock = threading.Lock()
+        self._tab_local = threading.local()
+        self._current_tab = self.driver.current_window_handle
+        self._idle_tabs: List[str] = [self._current_tab]
+        self._prepare_tab()
+    
+    def _prepare_tab(self):
+        """Configure the focused tab; CDP commands only reach the focused tab"""
+        # The browser log mixes all tabs, so each page records its own errors
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                    {'source': ERROR_COLLECTOR_JS})
+    
+    def _get_tab(self) -> str:
+        """Return the calling thread's tab handle, opening a tab on first use"""
+        tab = getattr(self._tab_local, 'tab', None)
+        if tab is None:
+            with self._driver_lock:
+                if self._idle_tabs:
+                    tab = self._idle_tabs.pop()
+                else:
+                    self.driver.switch_to.new_window('tab')
+                    tab = self._current_tab = self.driver.current_window_handle
+                    self._prepare_tab()
+            self._tab_local.tab = tab
+        return tab
+    
+    def _in_tab(self, tab: str, command: Callable[[webdriver.Chrome], object]) -> object:
+        """Run a WebDriver command against tab, holding the driver lock"""
+        with self._driver_lock:
+            if self._current_tab != tab:
+                self.driver.switch_to.window(tab)
+                self._current_tab = tab
+            return command(self.driver)
+    
+    def _remember_rendered_explorer(self, digest: str, dimensions: List[str]):
+        """Record a cleanly rendered explorer page in cache_dir/explorer.json"""
+        with self._rendered_explorers_lock:
+            self._rendered_explorers[digest] = dimensions
+            cache_file = self.cache_dir / 'explorer.json'
+            tmp_file = cache_file.with_name(f"explorer.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(self._rendered_explorers))
+            os.replace(tmp_file, cache_file)
     
     def find_all_examples(self) -> List[Path]:
-        """Find all .arc files in examples directory (excluding legacy root artifacts)"""
-        return [p for p in self.examples_dir.rglob("*.arc")
-                if "legacy" not in p.relative_to(self.examples_dir).parts]
+        """Find all .arc files in examples directory (excluding legacy root artifacts)
+        
+        With caching on, each directory's listing is kept in cache_dir/index.json
+        along with its mtime, and only directories whose mtime has changed
+        are listed again; the rest cost one stat() each.
+        """
+        index_file = self.cache_dir / 'index.json' if self.cache_dir is not None else None
+        index: Dict[str, list] = {}
+        if index_file is not None:
+            try:
+                index = json.loads(index_file.read_text())
+            except (OSError, ValueError):
+                pass
+        
+        # Per directory, relative to examples_dir: [mtime_ns, .arc names, subdirectory names]
+        listing: Dict[str, list] = {}
+        examples = []
+        pending = ['.']
+        while pending:
+            rel = pending.pop()
+            directory = self.examples_dir / rel
+            try:
+                mtime = directory.stat().st_mtime_ns
+            except OSError:
+                continue
+            
+            entry = index.get(rel)
+            if entry is None or entry[0] != mtime:
+                arc_names, subdirs = [], []
+                with os.scandir(directory) as entries:
+                    for e in entries:
+                        if e.is_dir():
+                            if e.name != 'legacy':
+                                subdirs.append(e.name)
+                        elif e.name.endswith('.arc'):
+                            arc_names.append(e.name)
+                entry = [mtime, sorted(arc_names), sorted(subdirs)]
+            
+            listing[rel] = entry
+            examples.extend(directory / name for name in entry[1])
+            pending.extend(os.path.join(rel, name) for name in reversed(entry[2]))
+        
+        if index_file is not None and listing != index:
+            tmp_file = index_file.with_name(f"index.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(listing))
+            os.replace(tmp_file, index_file)
+        return examples
+    
+    def _artifact_stem(self, arc_file: Path) -> str:
+        """Artifact name prefix for arc_file, unique across examples_dir
+        
+        Examples in different directories can share a stem, so the path
+        relative to examples_dir is used, e.g.
+        automotive/adaptive_cruise_control.arc -> automotive__adaptive_cruise_control
+        """
+        try:
+            relative = arc_file.relative_to(self.examples_dir)
+        except ValueError:
+            return arc_file.stem
+        return '__'.join(relative.with_suffix('').parts)
     
     def test_compilation(self, arc_file: Path) -> TestResult:
         """Test basic compilation"""
@@ -82,10 +367,8 @@ class ArcLangTester:
         name = f"compile:{arc_file.stem}"
         
         try:
-            result = subprocess.run(
+            result = _run_with_timeout(
                 [self.arclang_bin, 'build', str(arc_file)],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
             
@@ -105,14 +388,12 @@ class ArcLangTester:
         """Test visualization export"""
         start = time.time()
         name = f"viz:{arc_file.stem}:{format}"
-        output_file = self.output_dir / f"{arc_file.stem}_{format}.html"
+        output_file = self.artifact_dir / f"{self._artifact_stem(arc_file)}_{format}.html"
         
         try:
-            result = subprocess.run(
+            result = _run_with_timeout(
                 [self.arclang_bin, 'export', str(arc_file), 
                  '-o', str(output_file), '-f', format],
-                capture_output=True,
-                text=True,
                 timeout=60
             )
             
@@ -121,15 +402,15 @@ class ArcLangTester:
             if result.returncode != 0:
                 return TestResult(name, 'fail', f'Export failed: {result.stderr[:200]}', duration)
             
-            if not output_file.exists():
+            file_size = _artifact_size(result.stdout, output_file)
+            if file_size is None:
                 return TestResult(name, 'fail', 'Output file not created', duration)
             
-            file_size = output_file.stat().st_size
-            
             if file_size < 100:
                 return TestResult(name, 'fail', f'Output too small: {file_size} bytes', duration, file_size)
             
-            return TestResult(name, 'pass', f'Export successful ({file_size} bytes)', duration, file_size)
+            return TestResult(name, 'pass', f'Export successful ({file_size} bytes)', duration, file_size,
+                              str(output_file))
         
         except subprocess.TimeoutExpired:
             return TestResult(name, 'fail', 'Export timeout (60s)', 60.0)
@@ -137,17 +418,19 @@ class ArcLangTester:
             return TestResult(name, 'fail', f'Export error: {str(e)}', time.time() - start)
     
     def test_explorer(self, arc_file: Path) -> TestResult:
-        """Test explorer generation and rendering"""
+        """Test explorer generation and rendering
+        
+        With caching on, a page byte-identical to one that already rendered
+        cleanly is passed without loading it in Chrome.
+        """
         start = time.time()
         name = f"explorer:{arc_file.stem}"
         output_file = arc_file.parent / f"{arc_file.stem}_explorer.html"
         
         try:
             # Generate explorer
-            result = subprocess.run(
+            result = _run_with_timeout(
                 [self.arclang_bin, 'explorer', str(arc_file)],
-                capture_output=True,
-                text=True,
                 timeout=60
             )
             
@@ -155,40 +438,53 @@ class ArcLangTester:
                 return TestResult(name, 'fail', f'Explorer generation failed: {result.stderr[:200]}', 
                                 time.time() - start)
             
-            if not output_file.exists():
+            file_size = _artifact_size(result.stdout, output_file)
+            if file_size is None:
                 return TestResult(name, 'fail', 'Explorer HTML not created', time.time() - start)
             
+            html_digest = None
+            if self.cache_dir is not None:
+                html_digest = _file_digest(output_file)
+                dimensions = self._rendered_explorers.get(html_digest)
+                if dimensions is not None:
+                    width, height = dimensions
+                    return TestResult(name, 'pass',
+                                      f'Explorer rendered successfully (SVG: {width}x{height}, '
+                                      f'{file_size} bytes, identical page)',
+                                      time.time() - start, file_size, str(output_file))
+            
             # Test with Selenium
             try:
-                self.driver.get(f"file://{output_file.absolute()}")
+                tab = self._get_tab()
+                url = f"file://{output_file.absolute()}"
                 
-                # Wait for SVG or diagram to load (max 10 seconds)
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "svg"))
-                )
+                def navigate(d: webdriver.Chrome):
+                    d.execute_script(MARK_STALE_JS)
+                    d.get(url)  # returns once navigation starts: page_load_strategy is 'none'
+                
+                self._in_tab(tab, navigate)
                 
-                # Check for errors in console
-                logs = self.driver.get_log('browser')
-                errors = [log for log in logs if log['level'] == 'SEVERE']
+                # Wait for SVG or diagram to load (max 10 seconds); scripts can
+                # fail while the old page unloads, so keep polling through that
+                width, height, errors = WebDriverWait(self.driver, 10, poll_frequency=0.05,
+                                                      ignored_exceptions=(WebDriverException,)).until(
+                    lambda _: self._in_tab(tab, lambda d: d.execute_script(EXPLORER_READY_JS))
+                )
                 
                 # Filter out ELK fallback errors (non-critical - dagre renders successfully)
-                critical_errors = [e for e in errors if 'ELK layout failed' not in e['message']]
+                critical_errors = [e for e in errors if 'ELK layout failed' not in e]
                 
                 if critical_errors:
-                    error_msg = '; '.join([e['message'][:100] for e in critical_errors[:3]])
+                    error_msg = '; '.join([e[:100] for e in critical_errors[:3]])
                     return TestResult(name, 'fail', f'Browser errors: {error_msg}', 
                                     time.time() - start)
                 
-                # Check SVG dimensions
-                svg = self.driver.find_element(By.TAG_NAME, "svg")
-                width = svg.get_attribute("width")
-                height = svg.get_attribute("height")
-                
-                file_size = output_file.stat().st_size
+                if html_digest is not None:
+                    self._remember_rendered_explorer(html_digest, [width, height])
                 
                 return TestResult(name, 'pass', 
                                 f'Explorer rendered successfully (SVG: {width}x{height}, {file_size} bytes)', 
-                                time.time() - start, file_size)
+                                time.time() - start, file_size, str(output_file))
             
             except Exception as e:
                 return TestResult(name, 'fail', f'Selenium test failed: {str(e)}', 
@@ -212,14 +508,12 @@ class ArcLangTester:
         }
         
         ext = ext_map.get(format, '.txt')
-        output_file = self.output_dir / f"{arc_file.stem}_{format}{ext}"
+        output_file = self.artifact_dir / f"{self._artifact_stem(arc_file)}_{format}{ext}"
         
         try:
-            result = subprocess.run(
+            result = _run_with_timeout(
                 [self.arclang_bin, 'export', str(arc_file), 
                  '-o', str(output_file), '-f', format],
-                capture_output=True,
-                text=True,
                 timeout=30
             )
             
@@ -228,23 +522,96 @@ class ArcLangTester:
             if result.returncode != 0:
                 return TestResult(name, 'fail', f'Export failed: {result.stderr[:200]}', duration)
             
-            if not output_file.exists():
+            file_size = _artifact_size(result.stdout, output_file)
+            if file_size is None:
                 return TestResult(name, 'fail', 'Output file not created', duration)
             
-            file_size = output_file.stat().st_size
-            
             if file_size < 10:
                 return TestResult(name, 'fail', f'Output too small: {file_size} bytes', duration, file_size)
             
-            return TestResult(name, 'pass', f'Export successful ({file_size} bytes)', duration, file_size)
+            return TestResult(name, 'pass', f'Export successful ({file_size} bytes)', duration, file_size,
+                              str(output_file))
         
         except subprocess.TimeoutExpired:
             return TestResult(name, 'fail', 'Export timeout (30s)', 30.0)
         except Exception as e:
             return TestResult(name, 'fail', f'Export error: {str(e)}', time.time() - start)
     
+    # Test methods subject to fail-fast, by result name category. Compilation
+    # is left out: a failed compile already skips the rest of its example.
+    FAIL_FAST_CATEGORIES = {
+        'test_viz_export': 'viz',
+        'test_other_exports': 'export',
+        'test_explorer': 'explorer',
+    }
+    
+    def run_test(self, test: Callable[..., TestResult], arc_file: Path, *args: str) -> TestResult:
+        """Run a test through the cache, skipping it if its category is failing fast"""
+        category = self.FAIL_FAST_CATEGORIES.get(test.__name__)
+        if category is None or self.fail_fast <= 0:
+            return self.run_cached(test, arc_file, *args)
+        
+        streak_key = (category, *args)
+        with self._fail_streak_lock:
+            streak = self._fail_streak.get(streak_key, 0)
+        if streak >= self.fail_fast:
+            name = ':'.join((category, arc_file.stem, *args))
+            label = ':'.join(streak_key)
+            return TestResult(name, 'skip', f'Skipped after {streak} consecutive {label} failures', 0.0)
+        
+        result = self.run_cached(test, arc_file, *args)
+        with self._fail_streak_lock:
+            if result.status == 'fail':
+                self._fail_streak[streak_key] = self._fail_streak.get(streak_key, 0) + 1
+            else:
+                self._fail_streak[streak_key] = 0
+        return result
+    
+    def run_cached(self, test: Callable[..., TestResult], arc_file: Path, *args: str) -> TestResult:
+        """Run test(arc_file, *args), reusing an earlier pass for the same inputs
+        
+        Passing results are stored in cache_dir keyed by the digests of the
+        arclang binary and the .arc source, the source path (which names the
+        artifacts, see _artifact_stem), and the test and its arguments.
+        A cached pass is only reused while its artifact is still on disk
+        with the recorded size; failures are never cached.
+        """
+        if self.cache_dir is None:
+            return test(arc_file, *args)
+        
+        source_digest = self._source_digests.get(arc_file)
+        if source_digest is None:
+            source_digest = self._source_digests[arc_file] = _file_digest(arc_file)
+        key = hashlib.sha256('\0'.join(
+            [self._binary_digest, source_digest, str(arc_file), test.__name__, *args]
+        ).encode()).hexdigest()
+        entry_file = self.cache_dir / f"{key}.json"
+        
+        try:
+            entry = json.loads(entry_file.read_text())
+            artifact = entry['artifact']
+            if artifact is None or Path(artifact).stat().st_size == entry['file_size']:
+                return TestResult(entry['name'], 'pass', f"{entry['message']} (cached)", 0.0,
+                                  entry['file_size'], artifact)
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        result = test(arc_file, *args)
+        if result.status == 'pass':
+            # Write then rename so concurrent workers never read a partial entry
+            tmp_file = entry_file.with_name(f"{key}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json.dumps(asdict(result)))
+            os.replace(tmp_file, entry_file)
+        return result
+    
     def run_all_tests(self):
-        """Run comprehensive test suite"""
+        """Run comprehensive test suite
+
+        Examples are tested concurrently on up to `jobs` worker threads;
+        each test mostly waits on an arclang subprocess. An example's
+        exports and explorer run once it compiles. Explorer tests run on
+        a separate pool of `explorer_jobs` threads, one Chrome tab per thread.
+        """
         examples = self.find_all_examples()
         
         print(f"\n{'='*80}")
@@ -254,50 +621,62 @@ class ArcLangTester:
         print(f"Testing {len(self.viz_formats)} visualization formats")
         print(f"Testing {len(self.export_formats)} export formats")
         print(f"Output directory: {self.output_dir}")
+        if self.artifact_dir != self.output_dir:
+            print(f"Artifact directory: {self.artifact_dir}")
+        print(f"Parallel jobs: {self.jobs} ({self.explorer_jobs} for explorer)")
         print(f"{'='*80}\n")
         
         total_tests = len(examples) * (1 + len(self.viz_formats) + 1 + len(self.export_formats))
         current_test = 0
         
-        for arc_file in examples:
-            print(f"\n{'─'*80}")
-            print(f"Testing: {arc_file.relative_to(self.examples_dir)}")
-            print(f"{'─'*80}")
-            
-            # 1. Test compilation
-            current_test += 1
-            print(f"[{current_test}/{total_tests}] Compiling...")
-            result = self.test_compilation(arc_file)
-            self.results.append(result)
-            self.print_result(result)
-            
-            if result.status == 'fail':
-                print(f"  ⚠ Skipping other tests for {arc_file.stem} due to compilation failure")
-                continue
-            
-            # 2. Test all viz formats
-            for viz_format in self.viz_formats:
-                current_test += 1
-                print(f"[{current_test}/{total_tests}] Testing viz format: {viz_format}...")
-                result = self.test_viz_export(arc_file, viz_format)
-                self.results.append(result)
-                self.print_result(result)
-            
-            # 3. Test explorer
-            current_test += 1
-            print(f"[{current_test}/{total_tests}] Testing explorer...")
-            result = self.test_explorer(arc_file)
-            self.results.append(result)
-            self.print_result(result)
+        # Results keyed by (example index, step) so the report keeps the
+        # sequential order regardless of completion order
+        ordered: Dict[Tuple[int, int], TestResult] = {}
+        pending: Dict[Future, Tuple[int, int, Path]] = {}
+        
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool, \
+                ThreadPoolExecutor(max_workers=self.explorer_jobs) as browser:
+            for index, arc_file in enumerate(examples):
+                task = pool.submit(self.run_test, self.test_compilation, arc_file)
+                pending[task] = (index, 0, arc_file)
             
-            # 4. Test other export formats
-            for export_format in self.export_formats:
-                current_test += 1
-                print(f"[{current_test}/{total_tests}] Testing export format: {export_format}...")
-                result = self.test_other_exports(arc_file, export_format)
-                self.results.append(result)
-                self.print_result(result)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, step, arc_file = pending.pop(future)
+                    result = future.result()
+                    ordered[(index, step)] = result
+                    current_test += 1
+                    print(f"[{current_test}/{total_tests}]", end="")
+                    self.print_result(result)
+                    
+                    if step != 0:
+                        continue
+                    
+                    # 1. Compilation gates the remaining tests for this example
+                    if result.status == 'fail':
+                        print(f"  ⚠ Skipping other tests for {arc_file.stem} due to compilation failure")
+                        continue
+                    
+                    # 2. Test all viz formats
+                    for viz_format in self.viz_formats:
+                        step += 1
+                        task = pool.submit(self.run_test, self.test_viz_export, arc_file, viz_format)
+                        pending[task] = (index, step, arc_file)
+                    
+                    # 3. Test explorer
+                    step += 1
+                    task = browser.submit(self.run_test, self.test_explorer, arc_file)
+                    pending[task] = (index, step, arc_file)
+                    
+                    # 4. Test other export formats
+                    for export_format in self.export_formats:
+                        step += 1
+                        task = pool.submit(self.run_test, self.test_other_exports, arc_file,
+                                           export_format)
+                        pending[task] = (index, step, arc_file)
         
+        self.results.extend(ordered[key] for key in sorted(ordered))
         self.cleanup()
     
     def print_result(self, result: TestResult):
@@ -313,14 +692,28 @@ class ArcLangTester:
     
     def generate_report(self) -> str:
         """Generate comprehensive test report"""
+        # One pass for the totals, per-category grouping and failure list
+        totals: Counter = Counter()
+        category_passed: Counter = Counter()
+        categories: Dict[str, List[TestResult]] = defaultdict(list)
+        failures: List[TestResult] = []
+        for result in self.results:
+            category = result.name.split(':', 1)[0]
+            totals[result.status] += 1
+            categories[category].append(result)
+            if result.status == 'pass':
+                category_passed[category] += 1
+            elif result.status == 'fail':
+                failures.append(result)
+        
         total = len(self.results)
-        passed = sum(1 for r in self.results if r.status == 'pass')
-        failed = sum(1 for r in self.results if r.status == 'fail')
-        skipped = sum(1 for r in self.results if r.status == 'skip')
+        passed = totals['pass']
+        failed = totals['fail']
+        skipped = totals['skip']
         
         pass_rate = (passed / total * 100) if total > 0 else 0
         
-        report = f"""
+        parts: List[str] = [f"""
 {'='*80}
 ArcLang Test Report
 {'='*80}
@@ -336,43 +729,31 @@ Status: {'✓ PASS' if failed == 0 else '✗ FAIL'}
 {'='*80}
 
 Detailed Results:
-"""
-        
-        # Group by category
-        categories = {}
-        for result in self.results:
-            category = result.name.split(':')[0]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(result)
+"""]
         
         for category, results in sorted(categories.items()):
-            cat_passed = sum(1 for r in results if r.status == 'pass')
+            cat_passed = category_passed[category]
             cat_total = len(results)
             cat_rate = (cat_passed / cat_total * 100) if cat_total > 0 else 0
             
-            report += f"\n{category.upper()}: {cat_passed}/{cat_total} ({cat_rate:.1f}%)\n"
-            report += f"{'-'*80}\n"
+            parts.append(f"\n{category.upper()}: {cat_passed}/{cat_total} ({cat_rate:.1f}%)\n")
+            parts.append(f"{'-'*80}\n")
             
             for result in results:
                 status_symbol = '✓' if result.status == 'pass' else '✗' if result.status == 'fail' else '⊘'
-                report += f"  {status_symbol} {result.name}\n"
-                report += f"     {result.message}\n"
+                parts.append(f"  {status_symbol} {result.name}\n     {result.message}\n")
                 if result.status == 'fail':
-                    report += f"     Duration: {result.duration:.2f}s\n"
+                    parts.append(f"     Duration: {result.duration:.2f}s\n")
         
-        report += f"\n{'='*80}\n"
+        parts.append(f"\n{'='*80}\n")
         
         # Failed tests summary
         if failed > 0:
-            report += "\nFailed Tests:\n"
-            report += f"{'-'*80}\n"
-            for result in self.results:
-                if result.status == 'fail':
-                    report += f"  ✗ {result.name}\n"
-                    report += f"     {result.message}\n\n"
+            parts.append("\nFailed Tests:\n")
+            parts.append(f"{'-'*80}\n")
+            parts.extend(f"  ✗ {result.name}\n     {result.message}\n\n" for result in failures)
         
-        return report
+        return "".join(parts)
     
     def save_report(self, filename: str):
         """Save report to file"""
@@ -387,24 +768,39 @@ Detailed Results:
         
         # Also save JSON version
         json_file = self.output_dir / f"{filename}.json"
-        with open(json_file, 'w') as f:
-            json.dump([{
-                'name': r.name,
-                'status': r.status,
-                'message': r.message,
-                'duration': r.duration,
-                'file_size': r.file_size
-            } for r in self.results], f, indent=2)
+        if orjson is not None:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump([asdict(r) for r in self.results], f, indent=2)
         
         print(f"JSON report saved to: {json_file}")
     
     def cleanup(self):
         """Cleanup resources"""
-        if hasattr(self, 'driver'):
+        if self.driver:
             self.driver.quit()
+            self.driver = None
             print("\n✓ WebDriver closed")
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the ArcLang example test suite")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="number of tests to run concurrently (default: CPU count)")
+    parser.add_argument('--explorer-jobs', type=int, default=1,
+                        help="number of explorer tests to run concurrently, each in its "
+                             "own tab of a shared Chrome (default: 1)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="re-run every test instead of reusing cached passes")
+    parser.add_argument('--fail-fast', type=int, default=5, metavar='N',
+                        help="skip a test category after N consecutive failures "
+                             "(0 disables, default: 5)")
+    parser.add_argument('--tmpfs', action='store_true',
+                        help=f"write exported files to {TMPFS_ARTIFACT_DIR} (Linux tmpfs) "
+                             "instead of the output directory")
+    args = parser.parse_args()
+    
     # Configuration
     arclang_bin = './target/release/arclang'  # Use release build for speed
     examples_dir = '/Users/malek/Arclang/examples'
@@ -416,8 +812,17 @@ def main():
         print("  Please build first: cargo build --release --bin arclang")
         sys.exit(1)
     
+    artifact_dir = None
+    if args.tmpfs:
+        if os.path.isdir(TMPFS_ARTIFACT_DIR.parent):
+            artifact_dir = str(TMPFS_ARTIFACT_DIR)
+        else:
+            print(f"⚠ {TMPFS_ARTIFACT_DIR.parent} not found, writing exports to {output_dir}")
+    
     # Run tests
-    tester = ArcLangTester(arclang_bin, examples_dir, output_dir)
+    tester = ArcLangTester(arclang_bin, examples_dir, output_dir, jobs=args.jobs,
+                           explorer_jobs=args.explorer_jobs, use_cache=not args.no_cache,
+                           fail_fast=args.fail_fast, artifact_dir=artifact_dir)
     tester.run_all_tests()
     tester.save_report('test_report.txt')
     
@@ -1,23 +1,15 @@
 #!/usr/bin/env python3
-import xml.etree.ElementTree as ET
 import sys
+from xml.sax.saxutils import escape
 
-xml_file = sys.argv[1]
-svg_file = sys.argv[2]
-
-tree = ET.parse(xml_file)
-root = tree.getroot()
-
-ns = {'capella': 'http://www.polarsys.org/capella/core/1.4.0'}
-
-requirements = root.findall('.//requirement')
-components = root.findall('.//component')
-traces = root.findall('.//trace')
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
-width = 1400
-height = 1000
-
-svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+# SVG document templates: the header is formatted once per run, the
+# per-element fragments once per element with format_map.
+SVG_HEADER_TMPL = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
   <defs>
     <marker id="arrowhead" markerWidth="10" markerHeight="10" refX="9" refY="3" orient="auto">
@@ -36,73 +28,155 @@ svg = f'''<?xml version="1.0" encoding="UTF-8"?>
   
   <rect x="0" y="0" width="{width}" height="{height}" fill="#FAFAFA"/>
   
-  <text x="{width//2}" y="30" class="text title" font-size="20">Adaptive Cruise Control - Logical Architecture</text>
+  <text x="{cx}" y="30" class="text title" font-size="20">Adaptive Cruise Control - Logical Architecture</text>
 '''
+REQ_TMPL = (
+    '  <rect x="{x}" y="{y}" width="{w}" height="{h}" class="requirement" rx="5"/>\n'
+    '  <text x="{cx}" y="{ty}" class="text title">{rid}</text>\n'
+    '  <text x="{cx}" y="{dy}" class="text" font-size="10">{desc}</text>\n'
+    '  <text x="{cx}" y="{py}" class="text" font-size="9" fill="#666">{prio}</text>\n'
+)
+COMP_TMPL = (
+    '  <rect x="{x}" y="{y}" width="{w}" height="{h}" class="component" rx="5"/>\n'
+    '  <text x="{cx}" y="{ty}" class="text title">{cid}</text>\n'
+    '  <text x="{cx}" y="{ny}" class="text" font-size="10">{name}</text>\n'
+)
+COMP_WRAPPED_TMPL = (
+    '  <rect x="{x}" y="{y}" width="{w}" height="{h}" class="component" rx="5"/>\n'
+    '  <text x="{cx}" y="{ty}" class="text title">{cid}</text>\n'
+    '  <text x="{cx}" y="{l1y}" class="text" font-size="10">{line1}</text>\n'
+    '  <text x="{cx}" y="{l2y}" class="text" font-size="10">{line2}</text>\n'
+)
+TRACE_TMPL = '  <line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" class="{cls}"/>\n'
+SVG_FOOTER = '</svg>'
+
+TRACE_CLASS_BY_TYPE = {'satisfies': 'trace satisfies'}
+
+
+def _short(s, n=40, k=37):
+    """Truncate s to k chars plus an ellipsis when longer than n."""
+    return s if len(s) <= n else s[:k] + '...'
+
+
+def _text(value):
+    """Escape a model value for use as SVG text content."""
+    return escape(str(value))
+
+
+xml_file = sys.argv[1]
+svg_file = sys.argv[2]
+
+CAPELLA_NS = '{http://www.polarsys.org/capella/core/1.4.0}'
+
+# Single streaming pass over the input: keep only the attributes we render
+# and clear each element once consumed so the DOM never materialises.
+REQ_ATTRS = ('id', 'description', 'priority')
+COMP_ATTRS = ('id', 'name')
+TRACE_ATTRS = ('from', 'to', 'type')
+
+requirements = []
+components = []
+traces = []
+
+# Tag -> (target list, attributes), for both bare and capella-qualified tags.
+collect = {}
+for tag, target, attrs in (('requirement', requirements, REQ_ATTRS),
+                           ('component', components, COMP_ATTRS),
+                           ('trace', traces, TRACE_ATTRS)):
+    collect[tag] = collect[CAPELLA_NS + tag] = (target, attrs)
+
+for _, elem in ET.iterparse(xml_file, events=('end',)):
+    entry = collect.get(elem.tag)
+    if entry is not None:
+        target, attrs = entry
+        target.append({k: elem.get(k) for k in attrs if k in elem.attrib})
+    elem.clear()
+
+width = 1400
+height = 1000
+
+header = SVG_HEADER_TMPL.format(width=width, height=height, cx=width//2)
 
 req_y = 80
 req_x_start = 50
 req_width = 280
 req_height = 60
 req_spacing = 20
+req_cols = 2
+req_dx = req_width + req_spacing
+req_dy = req_height + req_spacing
 
 positions = {}
 
-svg += '  <!-- Requirements -->\n'
-for i, req in enumerate(requirements):
-    x = req_x_start + (i % 2) * (req_width + req_spacing)
-    y = req_y + (i // 2) * (req_height + req_spacing)
-    positions[req.get('id')] = (x + req_width//2, y + req_height//2)
-    
-    svg += f'  <rect x="{x}" y="{y}" width="{req_width}" height="{req_height}" class="requirement" rx="5"/>\n'
-    svg += f'  <text x="{x + req_width//2}" y="{y + 20}" class="text title">{req.get("id")}</text>\n'
-    
-    desc = req.get('description', '')
-    if len(desc) > 40:
-        desc = desc[:37] + '...'
-    svg += f'  <text x="{x + req_width//2}" y="{y + 38}" class="text" font-size="10">{desc}</text>\n'
-    svg += f'  <text x="{x + req_width//2}" y="{y + 52}" class="text" font-size="9" fill="#666">{req.get("priority")}</text>\n'
-
 comp_y = 400
 comp_x_start = 50
 comp_width = 140
 comp_height = 80
 comp_spacing = 20
+comp_cols = 5
+comp_dx = comp_width + comp_spacing
+comp_dy = comp_height + comp_spacing
+
+# Stream straight to a large buffered file rather than holding the whole
+# SVG in memory: the header goes out in one write, elements line by line.
+# Model values are XML-escaped so names like "A & B" keep the SVG valid.
+with open(svg_file, 'w', buffering=1 << 20) as f:
+    write = f.write
+    write(header)
+
+    write('  <!-- Requirements -->\n')
+    for i, req in enumerate(requirements):
+        row, col = divmod(i, req_cols)
+        x = req_x_start + col * req_dx
+        y = req_y + row * req_dy
+        cx = x + req_width//2
+        rid = req.get('id')
+        desc = _short(req.get('description', ''))
+        prio = req.get('priority')
+        positions[rid] = (cx, y + req_height//2)
+
+        write(REQ_TMPL.format_map({
+            'x': x, 'y': y, 'w': req_width, 'h': req_height, 'cx': cx,
+            'ty': y + 20, 'dy': y + 38, 'py': y + 52,
+            'rid': _text(rid), 'desc': _text(desc), 'prio': _text(prio),
+        }))
+
+    write('  <!-- Components -->\n')
+    for i, comp in enumerate(components):
+        row, col = divmod(i, comp_cols)
+        x = comp_x_start + col * comp_dx
+        y = comp_y + row * comp_dy
+        cx = x + comp_width//2
+        cid = comp.get('id')
+        name = comp.get('name', '')
+        positions[cid] = (cx, y + comp_height//2)
+
+        fields = {'x': x, 'y': y, 'w': comp_width, 'h': comp_height, 'cx': cx,
+                  'ty': y + 25, 'cid': _text(cid)}
+        if len(name) > 15:
+            words = name.split()
+            fields['line1'] = _text(' '.join(words[:len(words)//2]))
+            fields['line2'] = _text(' '.join(words[len(words)//2:]))
+            fields['l1y'] = y + 45
+            fields['l2y'] = y + 58
+            write(COMP_WRAPPED_TMPL.format_map(fields))
+        else:
+            fields['name'] = _text(name)
+            fields['ny'] = y + 50
+            write(COMP_TMPL.format_map(fields))
+
+    write('  <!-- Traces -->\n')
+    for trace in traces[:30]:
+        p1 = positions.get(trace.get('from'))
+        p2 = positions.get(trace.get('to'))
+        if p1 is None or p2 is None:
+            continue
+
+        x1, y1 = p1
+        x2, y2 = p2
+        class_name = TRACE_CLASS_BY_TYPE.get(trace.get('type'), 'trace implements')
+        write(TRACE_TMPL.format_map({'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2, 'cls': class_name}))
 
-svg += '  <!-- Components -->\n'
-for i, comp in enumerate(components):
-    x = comp_x_start + (i % 5) * (comp_width + comp_spacing)
-    y = comp_y + (i // 5) * (comp_height + comp_spacing)
-    positions[comp.get('id')] = (x + comp_width//2, y + comp_height//2)
-    
-    svg += f'  <rect x="{x}" y="{y}" width="{comp_width}" height="{comp_height}" class="component" rx="5"/>\n'
-    svg += f'  <text x="{x + comp_width//2}" y="{y + 25}" class="text title">{comp.get("id")}</text>\n'
-    
-    name = comp.get('name', '')
-    if len(name) > 15:
-        words = name.split()
-        line1 = ' '.join(words[:len(words)//2])
-        line2 = ' '.join(words[len(words)//2:])
-        svg += f'  <text x="{x + comp_width//2}" y="{y + 45}" class="text" font-size="10">{line1}</text>\n'
-        svg += f'  <text x="{x + comp_width//2}" y="{y + 58}" class="text" font-size="10">{line2}</text>\n'
-    else:
-        svg += f'  <text x="{x + comp_width//2}" y="{y + 50}" class="text" font-size="10">{name}</text>\n'
-
-svg += '  <!-- Traces -->\n'
-for trace in traces[:30]:
-    from_id = trace.get('from')
-    to_id = trace.get('to')
-    trace_type = trace.get('type')
-    
-    if from_id in positions and to_id in positions:
-        x1, y1 = positions[from_id]
-        x2, y2 = positions[to_id]
-        
-        class_name = 'trace satisfies' if trace_type == 'satisfies' else 'trace implements'
-        svg += f'  <line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" class="{class_name}"/>\n'
-
-svg += '</svg>'
-
-with open(svg_file, 'w') as f:
-    f.write(svg)
+    write(SVG_FOOTER)
 
 print(f"SVG diagram generated: {svg_file}")